@@ -2,17 +2,45 @@
 
 import argparse
 import asyncio
+import functools
 import json
+import os
+import re
+import shlex
 import sys
-from typing import Dict, List, NoReturn, Optional, Tuple
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+)
 
-from keinonto.domain.services.word_form_manager import WordFormManager
 from keinonto.domain.value_objects.case import Case
 from keinonto.domain.value_objects.number import Number
 from keinonto.domain.value_objects.stem_type import StemType
-from keinonto.infrastructure.database import sqlite_repository as repo
-from keinonto.infrastructure.database.config import get_session
-from keinonto.presentation.api.word_generator import WordGenerator
+from keinonto.domain.value_objects.word_form import KEY_BY_NAME
+
+try:
+    import orjson
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from keinonto.domain.services.word_form_manager import WordFormManager
+    from keinonto.infrastructure.database import sqlite_repository as repo
+    from keinonto.presentation.api.word_generator import WordGenerator
 
 
 class CLIError(Exception):
@@ -47,6 +75,9 @@ class ValidationError(CLIError):
     """Error raised when validation fails."""
 
 
+# Validates the gradation of a form given form, case_str, case and number
+GradationValidator = Callable[[str, str, Case, Number], None]
+
 # Constants
 REQUIRED_FORMS = [
     "nominative_singular",  # Base form
@@ -158,6 +189,86 @@ CASE_RULES: Dict[Case, Dict[Number, List[str]]] = {
     },
 }
 
+# Intern endings and gradation markers once so that equal strings share a
+# single object with a cached hash throughout the lookup tables below
+CASE_RULES = {
+    case: {
+        number: [sys.intern(ending) for ending in endings]
+        for number, endings in rules.items()
+    }
+    for case, rules in CASE_RULES.items()
+}
+GRADATION_PATTERNS = {
+    sys.intern(pattern): {
+        sys.intern(grade): sys.intern(marker) for grade, marker in changes.items()
+    }
+    for pattern, changes in GRADATION_PATTERNS.items()
+}
+
+# Possessive suffix endings required on comitative plural forms
+COMITATIVE_POSSESSIVE_ENDINGS: Tuple[str, ...] = ("ien", "een")
+
+BACK_VOWELS: FrozenSet[str] = frozenset("aou")
+FRONT_VOWELS: FrozenSet[str] = frozenset("äöy")
+
+# Translation table that maps back and front vowels to control characters
+# that never occur in word forms, so a single str.translate call classifies
+# every vowel of a stem
+_BACK_MARK = "\x01"
+_FRONT_MARK = "\x02"
+_VOWEL_CLASS = str.maketrans(
+    {
+        **{vowel: _BACK_MARK for vowel in BACK_VOWELS},
+        **{vowel: _FRONT_MARK for vowel in FRONT_VOWELS},
+    }
+)
+
+# Valid endings per case and number, longest first, so that a single
+# C-level ``str.endswith(tuple)`` call replaces the per-ending loop
+CASE_RULES_TUPLES: Dict[Tuple[Case, Number], Tuple[str, ...]] = {
+    (case, number): tuple(sorted(endings, key=len, reverse=True))
+    for case, rules in CASE_RULES.items()
+    for number, endings in rules.items()
+}
+
+# Cases whose endings carry a back vowel (e.g. partitive -a) and must not
+# follow a front vowel stem
+BACK_ENDING_CASES: FrozenSet[Tuple[Case, Number]] = frozenset(
+    key
+    for key, endings in CASE_RULES_TUPLES.items()
+    if not BACK_VOWELS.isdisjoint(endings)
+)
+
+# Cases whose endings carry only front vowels and must not follow a back
+# vowel stem
+FRONT_ENDING_CASES: FrozenSet[Tuple[Case, Number]] = frozenset(
+    key
+    for key, endings in CASE_RULES_TUPLES.items()
+    if not FRONT_VOWELS.isdisjoint(endings) and key not in BACK_ENDING_CASES
+)
+
+# Lowercase "case_number" strings mapped to their parsed case and number
+CASE_NUMBER_LOOKUP: Dict[str, Tuple[Case, Number]] = KEY_BY_NAME
+
+# Bit position of every (case, number) pair in the grade bitmasks, so that
+# grade membership is a shift and mask instead of a set lookup
+_CASE_NUMBER_BIT: Dict[Tuple[Case, Number], int] = {
+    (case, number): case_index * len(Number) + number_index
+    for case_index, case in enumerate(Case)
+    for number_index, number in enumerate(Number)
+}
+STRONG_GRADE_MASK = sum(1 << _CASE_NUMBER_BIT[key] for key in STRONG_GRADE_CASES)
+WEAK_GRADE_MASK = sum(1 << _CASE_NUMBER_BIT[key] for key in WEAK_GRADE_CASES)
+
+# Valid argument values in declaration order, plus frozensets for O(1)
+# membership tests and the joined lists shown in error messages
+STEM_TYPE_VALUES: Tuple[str, ...] = tuple(t.value for t in StemType)
+CASE_VALUES: Tuple[str, ...] = tuple(c.value for c in Case)
+VALID_STEM_TYPES: FrozenSet[str] = frozenset(STEM_TYPE_VALUES)
+VALID_CASES: FrozenSet[str] = frozenset(CASE_VALUES)
+_STEM_TYPES_STR = ", ".join(STEM_TYPE_VALUES)
+_CASES_STR = ", ".join(CASE_VALUES)
+
 
 def load_json_forms(file_path: str) -> Dict[str, str]:
     """Load forms from a JSON file.
@@ -172,9 +283,8 @@ def load_json_forms(file_path: str) -> Dict[str, str]:
         FileError: If there are issues reading or parsing the file
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            forms = json.load(f)
-    except json.JSONDecodeError as e:
+        forms = _json_loads(Path(file_path).read_bytes())
+    except ValueError as e:  # Also covers invalid UTF-8
         raise FileError(f"Invalid JSON format: {str(e)}") from e
     except OSError as e:
         raise FileError(f"Error reading file: {str(e)}") from e
@@ -203,12 +313,82 @@ def validate_required_forms(forms: Dict[str, str]) -> None:
         raise FormValidationError(msg)
 
 
+def _index_markers(grade: str) -> Dict[str, List[str]]:
+    """Map each gradation marker of one grade to the patterns using it.
+
+    Args:
+        grade: Either "strong" or "weak"
+
+    Returns:
+        Dictionary mapping markers to pattern names in declaration order
+    """
+    index: Dict[str, List[str]] = {}
+    for pattern, changes in GRADATION_PATTERNS.items():
+        index.setdefault(changes[grade], []).append(pattern)
+    return index
+
+
+def _compile_marker_scanners(markers: Iterable[str]) -> Tuple[Pattern[str], ...]:
+    """Compile regexes that find every occurrence of the given markers.
+
+    One zero-width lookahead regex is built per marker length, so that
+    overlapping occurrences are reported and markers of different lengths
+    starting at the same position cannot shadow each other.
+
+    Args:
+        markers: Gradation markers to scan for; empty markers are skipped
+
+    Returns:
+        Compiled scanners, one per distinct marker length
+    """
+    by_length: Dict[int, List[str]] = {}
+    for marker in markers:
+        if marker:
+            by_length.setdefault(len(marker), []).append(re.escape(marker))
+    return tuple(
+        re.compile(f"(?=({'|'.join(alternatives)}))")
+        for alternatives in by_length.values()
+    )
+
+
+def _scan_markers(
+    word: str,
+    index: Dict[str, List[str]],
+    scanners: Tuple[Pattern[str], ...],
+) -> Set[str]:
+    """Collect all patterns whose marker occurs in a word.
+
+    Args:
+        word: Word form to scan
+        index: Marker index built by _index_markers
+        scanners: Marker regexes built by _compile_marker_scanners
+
+    Returns:
+        Set of pattern names with a marker found in the word
+    """
+    # Patterns with an empty marker (e.g. "k-") match any word
+    hits: Set[str] = set(index.get("", ()))
+    for scanner in scanners:
+        for marker in set(scanner.findall(word)):
+            hits.update(index[marker])
+    return hits
+
+
+STRONG_MARKERS = _index_markers("strong")
+WEAK_MARKERS = _index_markers("weak")
+_STRONG_SCANNERS = _compile_marker_scanners(STRONG_MARKERS)
+_WEAK_SCANNERS = _compile_marker_scanners(WEAK_MARKERS)
+
+
 def detect_gradation_pattern(
     nom_sg: str,
     gen_sg: str,
 ) -> Optional[str]:
     """Detect gradation pattern from nominative and genitive forms.
 
+    Both forms are scanned with precompiled regexes covering all gradation
+    markers instead of testing every pattern separately.
+
     Args:
         nom_sg: Nominative singular form
         gen_sg: Genitive singular form
@@ -216,116 +396,180 @@ def detect_gradation_pattern(
     Returns:
         Optional[str]: Detected gradation pattern or None if no pattern found
     """
-    for pattern, changes in GRADATION_PATTERNS.items():
-        if (changes["strong"] in nom_sg and changes["weak"] in gen_sg) or (
-            pattern == "k-" and "k" in nom_sg and "k" not in gen_sg
-        ):
+    strong_hits = _scan_markers(nom_sg, STRONG_MARKERS, _STRONG_SCANNERS)
+    if not strong_hits:
+        return None
+    weak_hits = _scan_markers(gen_sg, WEAK_MARKERS, _WEAK_SCANNERS)
+    for pattern in GRADATION_PATTERNS:
+        if pattern in strong_hits and pattern in weak_hits:
             return pattern
     return None
 
 
-def validate_gradation(
+def _skip_gradation(  # pylint: disable=unused-argument
     form: str,
     case_str: str,
     case: Case,
     number: Number,
-    detected_pattern: Optional[str],
 ) -> None:
-    """Validate gradation pattern in a form.
+    """Accept any form; used when no gradation pattern was detected."""
+
+
+def make_gradation_validator(
+    detected_pattern: Optional[str],
+) -> GradationValidator:
+    """Build a gradation validator specialized for one pattern.
+
+    The grade markers and the special handling of the disappearing k are
+    resolved once here, so validating the forms of a word does not look
+    up the pattern rules again for every form.
 
     Args:
-        form: Word form to validate
-        case_str: Original case string from input
-        case: Case of the form
-        number: Number of the form
         detected_pattern: Detected gradation pattern or None
 
-    Raises:
-        GradationError: If gradation pattern validation fails
+    Returns:
+        Callable taking form, case_str, case and number that raises
+        GradationError if the form does not follow the pattern
     """
     if not detected_pattern:
-        return
-
-    if (case, number) in STRONG_GRADE_CASES:
-        pattern_rules = GRADATION_PATTERNS[detected_pattern]
-        strong_grade = pattern_rules["strong"]
-        if pattern_rules["strong"] not in form and detected_pattern != "k-":
+        return _skip_gradation
+
+    pattern_rules = GRADATION_PATTERNS[detected_pattern]
+    strong_grade = pattern_rules["strong"]
+    weak_grade = pattern_rules["weak"]
+
+    if detected_pattern == "k-":
+
+        def validate_k_disappearance(
+            form: str,
+            case_str: str,
+            case: Case,
+            number: Number,
+        ) -> None:
+            bit = _CASE_NUMBER_BIT[(case, number)]
+            if (STRONG_GRADE_MASK >> bit) & 1 and "k" not in form:
+                msg = (
+                    f"Gradation error in {case_str}: {form}\n"
+                    f"Expected 'k' for {case.value} {number.value}"
+                )
+                raise GradationError(msg)
+            if (WEAK_GRADE_MASK >> bit) & 1 and "k" in form:
+                msg = (
+                    f"Gradation error in {case_str}: {form}\n"
+                    f"Expected 'k' to disappear in "
+                    f"{case.value} {number.value}"
+                )
+                raise GradationError(msg)
+
+        return validate_k_disappearance
+
+    def validate_grades(
+        form: str,
+        case_str: str,
+        case: Case,
+        number: Number,
+    ) -> None:
+        bit = _CASE_NUMBER_BIT[(case, number)]
+        if (STRONG_GRADE_MASK >> bit) & 1 and strong_grade not in form:
             msg = (
                 f"Gradation error in {case_str}: {form}\n"
                 f"Expected strong grade '{strong_grade}' "
                 f"for {case.value} {number.value}"
             )
             raise GradationError(msg)
-        if detected_pattern == "k-" and "k" not in form:
-            msg = (
-                f"Gradation error in {case_str}: {form}\n"
-                f"Expected 'k' for {case.value} {number.value}"
-            )
-            raise GradationError(msg)
-
-    if (case, number) in WEAK_GRADE_CASES:
-        pattern_rules = GRADATION_PATTERNS[detected_pattern]
-        weak_grade = pattern_rules["weak"]
-        if pattern_rules["weak"] not in form and detected_pattern != "k-":
+        if (WEAK_GRADE_MASK >> bit) & 1 and weak_grade not in form:
             msg = (
                 f"Gradation error in {case_str}: {form}\n"
                 f"Expected weak grade '{weak_grade}' "
                 f"for {case.value} {number.value}"
             )
             raise GradationError(msg)
-        if detected_pattern == "k-" and "k" in form:
-            msg = (
-                f"Gradation error in {case_str}: {form}\n"
-                f"Expected 'k' to disappear in "
-                f"{case.value} {number.value}"
-            )
-            raise GradationError(msg)
+
+    return validate_grades
+
+
+def validate_gradation(
+    form: str,
+    case_str: str,
+    case: Case,
+    number: Number,
+    detected_pattern: Optional[str],
+) -> None:
+    """Validate gradation pattern in a form.
+
+    Args:
+        form: Word form to validate
+        case_str: Original case string from input
+        case: Case of the form
+        number: Number of the form
+        detected_pattern: Detected gradation pattern or None
+
+    Raises:
+        GradationError: If gradation pattern validation fails
+    """
+    make_gradation_validator(detected_pattern)(form, case_str, case, number)
+
+
+def match_ending(form: str, valid_endings: Tuple[str, ...]) -> Optional[str]:
+    """Find the valid ending a form ends with.
+
+    Args:
+        form: Word form to inspect
+        valid_endings: Valid endings sorted longest first
+
+    Returns:
+        The longest matching ending, or None if no ending matches
+    """
+    return next(
+        (ending for ending in valid_endings if form.endswith(ending)),
+        None,
+    )
 
 
 def validate_vowel_harmony(
     form: str,
-    valid_endings: List[str],
+    case: Case,
+    number: Number,
+    matched_ending: Optional[str],
 ) -> None:
     """Validate vowel harmony in a form.
 
     Args:
         form: Word form to validate
-        valid_endings: List of valid endings for this case and number
+        case: Case of the form
+        number: Number of the form
+        matched_ending: Ending found by match_ending, or None
 
     Raises:
         VowelHarmonyError: If vowel harmony validation fails
     """
-    if not valid_endings:
+    if not matched_ending:
         return
 
-    stem_part = form[: -len(valid_endings[0])]
+    classed = form[: -len(matched_ending)].translate(_VOWEL_CLASS)
 
-    if any(ending in ["a", "o", "u"] for ending in valid_endings):
-        # Back vowel endings should only be used with back vowel words
-        front_vowels = set("äöy")
-        if any(c in front_vowels for c in stem_part):
-            msg = (
-                f"Vowel harmony mismatch in {form}\n"
-                "Back vowel endings used with front vowel stem"
-            )
-            raise VowelHarmonyError(msg)
+    # Back vowel endings should only be used with back vowel words
+    if (case, number) in BACK_ENDING_CASES and _FRONT_MARK in classed:
+        msg = (
+            f"Vowel harmony mismatch in {form}\n"
+            "Back vowel endings used with front vowel stem"
+        )
+        raise VowelHarmonyError(msg)
 
-    elif any(ending in ["ä", "ö", "y"] for ending in valid_endings):
-        # Front vowel endings should only be used with front vowel words
-        back_vowels = set("aou")
-        if any(c in back_vowels for c in stem_part):
-            msg = (
-                f"Vowel harmony mismatch in {form}\n"
-                "Front vowel endings used with back vowel stem"
-            )
-            raise VowelHarmonyError(msg)
+    # Front vowel endings should only be used with front vowel words
+    if (case, number) in FRONT_ENDING_CASES and _BACK_MARK in classed:
+        msg = (
+            f"Vowel harmony mismatch in {form}\n"
+            "Front vowel endings used with back vowel stem"
+        )
+        raise VowelHarmonyError(msg)
 
 
 def validate_form_ending(
     form: str,
     case: Case,
     number: Number,
-    valid_endings: List[str],
+    matched_ending: Optional[str],
 ) -> None:
     """Validate form ending.
 
@@ -333,31 +577,32 @@ def validate_form_ending(
         form: Word form to validate
         case: Case of the form
         number: Number of the form
-        valid_endings: List of valid endings for this case and number
+        matched_ending: Ending found by match_ending, or None
 
     Raises:
         EndingError: If form ending validation fails
     """
-    if not valid_endings:
+    if not CASE_RULES_TUPLES.get((case, number)):
         return
 
-    if not any(form.endswith(ending) for ending in valid_endings):
-        endings_str = "', '".join(valid_endings)
+    if matched_ending is None:
+        endings_str = "', '".join(CASE_RULES[case][number])
         msg = (
             f"Invalid {case.value} {number.value} form: {form}\n"
             f"Form should end in one of: '{endings_str}'"
         )
         raise EndingError(msg)
 
-    if case == Case.COMITATIVE and number == Number.PLURAL:
-        endings = ["i", "e"]
-        has_possessive = any(form.endswith(f"{e}en") for e in endings)
-        if not has_possessive:
-            msg = (
-                f"Invalid comitative form: {form}\n"
-                "Comitative forms require a possessive suffix (-en)"
-            )
-            raise EndingError(msg)
+    if (
+        case == Case.COMITATIVE
+        and number == Number.PLURAL
+        and not form.endswith(COMITATIVE_POSSESSIVE_ENDINGS)
+    ):
+        msg = (
+            f"Invalid comitative form: {form}\n"
+            "Comitative forms require a possessive suffix (-en)"
+        )
+        raise EndingError(msg)
 
 
 def parse_case_number(case_str: str) -> Tuple[Case, Number]:
@@ -374,9 +619,8 @@ def parse_case_number(case_str: str) -> Tuple[Case, Number]:
         CaseNumberFormatError: If case/number format is invalid
     """
     try:
-        case_part, number_part = case_str.lower().split("_")
-        return Case(case_part), Number(number_part)
-    except ValueError as e:
+        return CASE_NUMBER_LOOKUP[case_str.lower()]
+    except KeyError as e:
         msg = (
             f"Invalid case/number format: {case_str}\n"
             "Format should be 'case_number' "
@@ -385,24 +629,23 @@ def parse_case_number(case_str: str) -> Tuple[Case, Number]:
         raise CaseNumberFormatError(msg) from e
 
 
-def validate_form(
+def _check_form_grade(
     case_str: str,
     form: str,
-    detected_pattern: Optional[str],
-) -> None:
-    """Validate a single form.
+    gradation_validator: GradationValidator,
+) -> Tuple[Case, Number]:
+    """Check a form's type, case/number string and gradation.
 
     Args:
         case_str: String in format case_number
         form: Word form to validate
-        detected_pattern: Detected gradation pattern or None
+        gradation_validator: Validator built by make_gradation_validator
+
+    Returns:
+        Tuple of parsed case and number
 
     Raises:
         FormValidationError: If validation fails
-        GradationError: If gradation pattern validation fails
-        VowelHarmonyError: If vowel harmony validation fails
-        CaseNumberFormatError: If case/number format is invalid
-        EndingError: If form ending is invalid
     """
     if not isinstance(form, str):
         raise FormValidationError(f"Form must be a string: {case_str}")
@@ -411,14 +654,103 @@ def validate_form(
 
     case, number = parse_case_number(case_str)
 
-    validate_gradation(form, case_str, case, number, detected_pattern)
+    gradation_validator(form, case_str, case, number)
+    return case, number
 
-    if case not in CASE_RULES or number not in CASE_RULES[case]:
+
+def _validate_form(
+    case_str: str,
+    form: str,
+    gradation_validator: GradationValidator,
+) -> None:
+    """Validate a single form with a prepared gradation validator.
+
+    Args:
+        case_str: String in format case_number
+        form: Word form to validate
+        gradation_validator: Validator built by make_gradation_validator
+
+    Raises:
+        FormValidationError: If validation fails
+    """
+    case, number = _check_form_grade(case_str, form, gradation_validator)
+
+    valid_endings = CASE_RULES_TUPLES.get((case, number))
+    if not valid_endings:
         return
 
-    valid_endings = CASE_RULES[case][number]
-    validate_form_ending(form, case, number, valid_endings)
-    validate_vowel_harmony(form, valid_endings)
+    # Match the ending once and share it between both checks; the stem
+    # part used for vowel harmony is whatever precedes the actual ending
+    matched_ending = match_ending(form, valid_endings)
+    validate_form_ending(form, case, number, matched_ending)
+    validate_vowel_harmony(form, case, number, matched_ending)
+
+
+def validate_forms_batch(items: Iterable[Tuple[str, Case, Number]]) -> None:
+    """Validate the endings and vowel harmony of many forms at once.
+
+    Forms are grouped by case and number so that each group's rules are
+    looked up once. Vowel harmony of a whole group is checked with a single
+    translate over the joined stem parts; only a group containing a
+    mismatch is re-checked form by form to report the offending form.
+
+    Args:
+        items: Tuples of form, case and number
+
+    Raises:
+        EndingError: If a form ending is invalid
+        VowelHarmonyError: If vowel harmony validation fails
+    """
+    groups: Dict[Tuple[Case, Number], List[str]] = {}
+    for form, case, number in items:
+        groups.setdefault((case, number), []).append(form)
+
+    for (case, number), forms in groups.items():
+        valid_endings = CASE_RULES_TUPLES.get((case, number))
+        if not valid_endings:
+            continue
+
+        matched_endings = [match_ending(form, valid_endings) for form in forms]
+        for form, matched_ending in zip(forms, matched_endings):
+            validate_form_ending(form, case, number, matched_ending)
+
+        if (case, number) in BACK_ENDING_CASES:
+            mismatch_mark = _FRONT_MARK
+        elif (case, number) in FRONT_ENDING_CASES:
+            mismatch_mark = _BACK_MARK
+        else:
+            continue
+
+        stem_parts = "".join(
+            form[: -len(matched_ending)]
+            for form, matched_ending in zip(forms, matched_endings)
+            if matched_ending
+        )
+        if mismatch_mark in stem_parts.translate(_VOWEL_CLASS):
+            for form, matched_ending in zip(forms, matched_endings):
+                validate_vowel_harmony(form, case, number, matched_ending)
+
+
+def validate_form(
+    case_str: str,
+    form: str,
+    detected_pattern: Optional[str],
+) -> None:
+    """Validate a single form.
+
+    Args:
+        case_str: String in format case_number
+        form: Word form to validate
+        detected_pattern: Detected gradation pattern or None
+
+    Raises:
+        FormValidationError: If validation fails
+        GradationError: If gradation pattern validation fails
+        VowelHarmonyError: If vowel harmony validation fails
+        CaseNumberFormatError: If case/number format is invalid
+        EndingError: If form ending is invalid
+    """
+    _validate_form(case_str, form, make_gradation_validator(detected_pattern))
 
 
 def stem_type_arg(value: str) -> str:
@@ -434,10 +766,8 @@ def stem_type_arg(value: str) -> str:
         ArgumentTypeError: If the value is not a valid stem type
     """
     normalized = value.lower()
-    valid_types = [t.value for t in StemType]
-    if normalized not in valid_types:
-        types_str = ", ".join(valid_types)
-        msg = f"Invalid stem type. Choose from: {types_str}"
+    if normalized not in VALID_STEM_TYPES:
+        msg = f"Invalid stem type. Choose from: {_STEM_TYPES_STR}"
         raise argparse.ArgumentTypeError(msg)
     return normalized
 
@@ -445,14 +775,23 @@ def stem_type_arg(value: str) -> str:
 def case_type(value: str) -> str:
     """Convert case argument to proper format."""
     normalized = value.lower()
-    valid_cases = [c.value for c in Case]
-    if normalized not in valid_cases:
-        cases_str = ", ".join(valid_cases)
-        msg = f"Invalid case. Choose from: {cases_str}"
+    if normalized not in VALID_CASES:
+        msg = f"Invalid case. Choose from: {_CASES_STR}"
         raise argparse.ArgumentTypeError(msg)
     return normalized
 
 
+def positive_int(value: str) -> int:
+    """Convert an argument to an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid integer: {value}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError("Value must be at least 1")
+    return number
+
+
 def load_forms(file_path: str) -> Dict[str, str]:
     """Load and validate word forms from a JSON file.
 
@@ -487,14 +826,83 @@ def load_forms(file_path: str) -> Dict[str, str]:
         forms.get("genitive_singular", ""),
     )
 
+    gradation_validator = make_gradation_validator(detected_pattern)
+    items = []
     for case_str, form in forms.items():
-        validate_form(case_str, form, detected_pattern)
+        case, number = _check_form_grade(case_str, form, gradation_validator)
+        items.append((form, case, number))
+    validate_forms_batch(items)
 
     return forms
 
 
+def load_manifest(file_path: str) -> List[Dict[str, Any]]:
+    """Load a batch manifest describing words to add.
+
+    The manifest is a JSON list of entries. Forms file paths are resolved
+    relative to the manifest file.
+    Example format:
+    [
+        {
+            "base_form": "talo",
+            "declension_class": 1,
+            "forms_file": "talo.json",
+            "gradation": null
+        },
+        ...
+    ]
+
+    Args:
+        file_path: Path to the JSON manifest file
+
+    Returns:
+        List of manifest entries with resolved forms file paths
+
+    Raises:
+        FileError: If the manifest cannot be read or is malformed
+    """
+    try:
+        entries = _json_loads(Path(file_path).read_bytes())
+    except ValueError as e:  # Also covers invalid UTF-8
+        raise FileError(f"Invalid JSON format: {str(e)}") from e
+    except OSError as e:
+        raise FileError(f"Error reading file: {str(e)}") from e
+
+    if not isinstance(entries, list):
+        raise FileError("Manifest file must contain a list")
+
+    base_dir = os.path.dirname(file_path)
+    resolved = []
+    for entry in entries:
+        if (
+            not isinstance(entry, dict)
+            or not {
+                "base_form",
+                "declension_class",
+                "forms_file",
+            }
+            <= entry.keys()
+        ):
+            msg = (
+                f"Invalid manifest entry: {entry}\n"
+                "Entries need 'base_form', 'declension_class' and 'forms_file'"
+            )
+            raise FileError(msg)
+        resolved.append(
+            {
+                **entry,
+                "forms_file": os.path.join(base_dir, entry["forms_file"]),
+            }
+        )
+    return resolved
+
+
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser for the CLI."""
+    """Create the argument parser for the CLI.
+
+    The parser is built once and shared by all callers.
+    """
     desc = "CLI for testing word form generation"
     parser = argparse.ArgumentParser(description=desc)
     subparsers = parser.add_subparsers(dest="command")
@@ -519,6 +927,22 @@ def create_parser() -> argparse.ArgumentParser:
         help="Gradation pattern (e.g., 'k-kk', 't-tt')",
     )
 
+    # Add many words with forms
+    add_batch = subparsers.add_parser(
+        "add-forms-batch",
+        help="Add words with their forms listed in a JSON manifest",
+    )
+    add_batch.add_argument(
+        "manifest_file",
+        help="JSON manifest listing words and their forms files",
+    )
+    add_batch.add_argument(
+        "--concurrency",
+        type=positive_int,
+        default=16,
+        help="Maximum number of forms files loaded concurrently",
+    )
+
     # Add stem
     add_stem = subparsers.add_parser(
         "add-stem",
@@ -551,11 +975,23 @@ def create_parser() -> argparse.ArgumentParser:
         help="Case to generate",
     )
 
+    # Serve commands from stdin
+    subparsers.add_parser(
+        "serve",
+        help="Run commands read from stdin using a single database session",
+    )
+
+    # Create or upgrade the database schema
+    subparsers.add_parser(
+        "init-db",
+        help="Create the database tables and add indexes missing from it",
+    )
+
     return parser
 
 
 async def add_word_with_forms(
-    manager: WordFormManager,
+    manager: "WordFormManager",
     args: argparse.Namespace,
 ) -> None:
     """Add a word with its forms to the repository."""
@@ -569,8 +1005,65 @@ async def add_word_with_forms(
     print(f"Added word '{args.base_form}' with forms")
 
 
+async def add_forms_batch(
+    manager: "WordFormManager",
+    entries: List[Dict[str, Any]],
+    concurrency: int = 16,
+) -> None:
+    """Add many words with their forms to the repository.
+
+    All forms files are loaded and validated concurrently in worker
+    threads, bounded by a semaphore, before anything is written. On Python
+    3.11+ the loads run in a task group so that the first failure cancels
+    the rest. All words are then written in one bulk insert, since a single
+    database session does not allow concurrent operations anyway.
+
+    Args:
+        manager: Word form manager instance
+        entries: Manifest entries as returned by load_manifest
+        concurrency: Maximum number of forms files loaded concurrently
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+
+    async def load_one(entry: Dict[str, Any]) -> Dict[str, str]:
+        async with semaphore:
+            return await loop.run_in_executor(None, load_forms, entry["forms_file"])
+
+    if sys.version_info >= (3, 11):
+        # A task group cancels the remaining loads as soon as one fails
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(load_one(entry)) for entry in entries]
+        except BaseExceptionGroup as e:
+            raise e.exceptions[0] from None
+        all_forms = [task.result() for task in tasks]
+    else:
+        all_forms = await asyncio.gather(*(load_one(entry) for entry in entries))
+
+    await manager.add_words_bulk(
+        (
+            entry["base_form"],
+            entry["declension_class"],
+            forms,
+            entry.get("gradation"),
+        )
+        for entry, forms in zip(entries, all_forms)
+    )
+
+
+async def add_words_from_manifest(
+    manager: "WordFormManager",
+    args: argparse.Namespace,
+) -> None:
+    """Add the words listed in a manifest file to the repository."""
+    entries = load_manifest(args.manifest_file)
+    await add_forms_batch(manager, entries, args.concurrency)
+    print(f"Added {len(entries)} words with forms")
+
+
 async def add_word_stem(
-    repository: repo.SQLiteWordRepository,
+    repository: "repo.SQLiteWordRepository",
     args: argparse.Namespace,
 ) -> None:
     """Add a stem for a word."""
@@ -587,7 +1080,7 @@ async def add_word_stem(
 
 
 async def get_word_info(
-    repository: repo.SQLiteWordRepository,
+    repository: "repo.SQLiteWordRepository",
     args: argparse.Namespace,
 ) -> None:
     """Get information about a word."""
@@ -608,7 +1101,7 @@ async def get_word_info(
 
 
 async def generate_form(
-    generator: WordGenerator,
+    generator: "WordGenerator",
     base_form: str,
     case: str,
 ) -> None:
@@ -626,53 +1119,155 @@ async def generate_form(
     print(form)
 
 
+async def dispatch_command(
+    repository: "repo.SQLiteWordRepository",
+    args: argparse.Namespace,
+) -> None:
+    """Run a parsed command against an open repository.
+
+    Args:
+        repository: Repository bound to an open database session
+        args: Parsed command line arguments
+    """
+    # Imported lazily so that argument errors and help output do not pay
+    # for loading the services
+    # pylint: disable=import-outside-toplevel
+    if args.command == "add-forms":
+        from keinonto.domain.services.word_form_manager import WordFormManager
+
+        await add_word_with_forms(WordFormManager(repository), args)
+    elif args.command == "add-forms-batch":
+        from keinonto.domain.services.word_form_manager import WordFormManager
+
+        await add_words_from_manifest(WordFormManager(repository), args)
+    elif args.command == "add-stem":
+        await add_word_stem(repository, args)
+    elif args.command == "info":
+        await get_word_info(repository, args)
+    elif args.command == "gen":
+        from keinonto.presentation.api.word_generator import WordGenerator
+
+        await generate_form(WordGenerator(repository), args.base_form, args.case)
+
+
+async def serve(
+    repository: "repo.SQLiteWordRepository",
+    session: "AsyncSession",
+) -> None:
+    """Run commands read line by line from stdin.
+
+    Every line is parsed like a regular command line and run against the
+    same repository, so the database session is opened only once. Errors
+    are reported per command without stopping the loop, and database
+    errors roll the session back so that later commands can still use it.
+
+    Args:
+        repository: Repository bound to an open database session
+        session: The session the repository is bound to
+    """
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy.exc import SQLAlchemyError
+
+    parser = create_parser()
+    loop = asyncio.get_running_loop()
+
+    while True:
+        line = await loop.run_in_executor(None, sys.stdin.readline)
+        if not line:
+            break
+
+        try:
+            tokens = shlex.split(line)
+        except ValueError as e:
+            print(f"Invalid input: {str(e)}", file=sys.stderr)
+            continue
+        if not tokens:
+            continue
+
+        try:
+            args = parser.parse_args(tokens)
+        except SystemExit:
+            # argparse has already reported the problem
+            continue
+        if args.command in (None, "serve", "init-db"):
+            print("Error: Expected a command to run", file=sys.stderr)
+            continue
+
+        try:
+            await dispatch_command(repository, args)
+        except CLIError as e:
+            print(f"Error: {str(e)}", file=sys.stderr)
+        except (ValueError, TypeError) as e:
+            print(f"Invalid input: {str(e)}", file=sys.stderr)
+        except SQLAlchemyError as e:
+            await session.rollback()
+            print(f"Database error: {str(e)}", file=sys.stderr)
+        sys.stdout.flush()
+
+
 async def run_command(args: argparse.Namespace) -> None:
     """Run the specified command."""
     if not args.command:
         create_parser().print_help()
-        sys.exit(1)
+        raise SystemExit(1)
+
+    # Imported lazily so that argument errors and help output do not pay
+    # for loading the database stack
+    # pylint: disable=import-outside-toplevel
+    from keinonto.infrastructure.database import sqlite_repository as repo
+    from keinonto.infrastructure.database.config import (
+        get_session,
+        init_schema,
+        shutdown,
+    )
+
+    try:
+        if args.command == "init-db":
+            await init_schema()
+            print("Database schema is up to date")
+            return
 
-    async with get_session() as session:
-        repository = repo.SQLiteWordRepository(session)
-        manager = WordFormManager(repository)
-        generator = WordGenerator(repository)
+        async with get_session() as session:
+            repository = repo.SQLiteWordRepository(session)
 
-        if args.command == "add-forms":
-            await add_word_with_forms(manager, args)
-        elif args.command == "add-stem":
-            await add_word_stem(repository, args)
-        elif args.command == "info":
-            await get_word_info(repository, args)
-        elif args.command == "gen":
-            await generate_form(generator, args.base_form, args.case)
+            if args.command == "serve":
+                await serve(repository, session)
+            else:
+                await dispatch_command(repository, args)
+    finally:
+        await shutdown()
 
 
-async def main() -> NoReturn:
-    """Run the CLI application."""
+async def main() -> int:
+    """Run the CLI application.
+
+    Returns:
+        Process exit code
+    """
     try:
         args = create_parser().parse_args()
         await run_command(args)
-        sys.exit(0)
+        return 0
     except CLIError as e:
         print(f"Error: {str(e)}", file=sys.stderr)
-        sys.exit(1)
+        return 1
     except KeyboardInterrupt:
         print("\nOperation cancelled by user", file=sys.stderr)
-        sys.exit(130)
+        return 130
     except (ValueError, TypeError) as e:
         print(f"Invalid input: {str(e)}", file=sys.stderr)
-        sys.exit(1)
+        return 1
     except OSError as e:
         print(f"System error: {str(e)}", file=sys.stderr)
-        sys.exit(2)
+        return 2
     except Exception as e:  # pylint: disable=broad-except
         err = f"{e.__class__.__name__}: {str(e)}"
         print(
             f"Unexpected error: {err}",
             file=sys.stderr,
         )
-        sys.exit(2)
+        return 2
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    sys.exit(asyncio.run(main()))
@@ -1,36 +1,94 @@
 """Word entity module."""
 
-from typing import List, Optional
-
-from pydantic import BaseModel, Field
+import functools
+import sys
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 from ..value_objects.stem_type import StemType
 
+# Slotted dataclasses are only available from Python 3.10 onwards
+_DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
 
-class WordStem(BaseModel):
-    """Word stem model."""
-
-    stem_type: StemType
-    value: str
 
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class Word:
+    """Word model.
 
-class Word(BaseModel):
-    """Word model."""
+    Attributes:
+        base_form: Dictionary form of the word
+        declension_class: Noun declension class (1-51)
+        gradation_type: Consonant gradation pattern if applicable
+        stems: Stems of the word keyed by stem type, stored read-only
+    """
 
     base_form: str
-    declension_class: int = Field(
-        ...,
-        ge=1,
-        le=51,
-        description="Noun declension class (1-51)",
-    )
-    gradation_type: Optional[str] = Field(
-        None,
-        description="Consonant gradation pattern if applicable",
-    )
-    stems: List[WordStem] = []
-
-    class Config:
-        """Pydantic model configuration."""
-
-        frozen = True  # Make instances immutable
+    declension_class: int
+    gradation_type: Optional[str] = None
+    stems: Mapping[StemType, str] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Validate the declension class and freeze the stems.
+
+        Words are shared through the repository cache, so the stems are
+        copied into a read-only mapping that no caller can change.
+
+        Raises:
+            ValueError: If the declension class is not within 1-51
+        """
+        if not 1 <= self.declension_class <= 51:
+            msg = (
+                f"Invalid declension class: {self.declension_class}\n"
+                "Declension class must be between 1 and 51"
+            )
+            raise ValueError(msg)
+        object.__setattr__(self, "stems", MappingProxyType(dict(self.stems)))
+
+    @classmethod
+    def validated(
+        cls,
+        base_form: str,
+        declension_class: int,
+        gradation_type: Optional[str] = None,
+        stems: Optional[Dict[StemType, str]] = None,
+    ) -> "Word":
+        """Create a word from untrusted input, validating field types.
+
+        Field values are validated and coerced with pydantic, which is only
+        imported on first use. Trusted data such as repository rows should
+        use the plain constructor instead.
+
+        Args:
+            base_form: Dictionary form of the word
+            declension_class: Noun declension class (1-51)
+            gradation_type: Consonant gradation pattern if applicable
+            stems: Stems of the word keyed by stem type
+
+        Returns:
+            The validated word
+
+        Raises:
+            ValueError: If a field has an invalid type or value
+        """
+        word: Word = _word_adapter().validate_python(
+            {
+                "base_form": base_form,
+                "declension_class": declension_class,
+                "gradation_type": gradation_type,
+                "stems": stems or {},
+            }
+        )
+        return word
+
+
+@functools.lru_cache(maxsize=1)
+def _word_adapter() -> Any:
+    """Build the pydantic adapter used by Word.validated."""
+    # Imported lazily to keep pydantic off the import path of plain entities
+    # pylint: disable=import-outside-toplevel
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(Word)
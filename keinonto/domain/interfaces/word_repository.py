@@ -1,7 +1,6 @@
 """Interface for word data storage and retrieval."""
 
-from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Protocol, Sequence, Tuple
 
 from ..entities.word import Word
 from ..value_objects.case import Case
@@ -9,14 +8,19 @@ from ..value_objects.number import Number
 from ..value_objects.stem_type import StemType
 
 
-class IWordRepository(ABC):
-    """Interface for word storage and retrieval."""
+class IWordRepository(Protocol):
+    """Interface for word storage and retrieval.
+
+    Repositories satisfy this protocol structurally and do not need to
+    inherit from it.
+    """
 
-    @abstractmethod
     async def get_word(self, base_form: str) -> Optional[Word]:
         """Retrieve a word by its base form."""
 
-    @abstractmethod
+    async def get_words(self, base_forms: Sequence[str]) -> Dict[str, Word]:
+        """Retrieve several words at once, keyed by base form."""
+
     async def get_form(
         self,
         word: Word,
@@ -25,22 +29,31 @@ class IWordRepository(ABC):
     ) -> Optional[str]:
         """Get a specific form of a word."""
 
-    @abstractmethod
     async def get_all_forms(
         self,
         word: Word,
     ) -> List[Tuple[Case, Number, str]]:
         """Get all available forms for a word."""
 
-    @abstractmethod
     async def get_stems(self, word: Word) -> Dict[StemType, str]:
         """Get all stems for a word."""
 
-    @abstractmethod
     async def save_word(self, word: Word) -> None:
         """Save a new word or update existing one."""
 
-    @abstractmethod
+    async def save_word_with_stems(
+        self,
+        word: Word,
+        stems: Dict[StemType, str],
+    ) -> None:
+        """Save a new word together with its stems."""
+
+    async def save_words_bulk(
+        self,
+        words: Sequence[Tuple[Word, Dict[StemType, str]]],
+    ) -> None:
+        """Save many new words together with their stems."""
+
     async def save_stem(
         self,
         word: Word,
@@ -1,6 +1,6 @@
 """Service for managing word forms and stems."""
 
-from typing import Dict, Optional
+from typing import Callable, ClassVar, Dict, Iterable, Optional, Tuple
 
 from keinonto.domain.entities.word import Word
 from keinonto.domain.interfaces.word_repository import IWordRepository
@@ -13,6 +13,18 @@ from keinonto.domain.value_objects.word_form import WordDeclension
 class WordFormManager:
     """Service for managing word forms and stems."""
 
+    # Form generation rules keyed by case and number; each rule builds the
+    # form from the word's stems
+    _RULES: ClassVar[
+        Dict[Tuple[Case, Number], Callable[[Dict[StemType, str]], str]]
+    ] = {
+        (Case.NOMINATIVE, Number.SINGULAR): lambda s: s[StemType.STRONG],
+        (Case.NOMINATIVE, Number.PLURAL): lambda s: s[StemType.PLURAL] + "t",
+        (Case.GENITIVE, Number.SINGULAR): lambda s: s[StemType.WEAK] + "n",
+        (Case.GENITIVE, Number.PLURAL): lambda s: s[StemType.PLURAL] + "ien",
+        # Add more cases and rules as needed
+    }
+
     def __init__(self, repository: IWordRepository):
         """Initialize the service.
 
@@ -48,17 +60,47 @@ class WordFormManager:
         )
         stems = declension.extract_stems()
 
-        # Create and save word
-        word = Word(
+        # Create and save word together with its stems
+        word = Word.validated(
             base_form=base_form,
             declension_class=declension_class,
             gradation_type=gradation_type,
         )
-        await self._repository.save_word(word)
+        await self._repository.save_word_with_stems(word, stems)
+
+    async def add_words_bulk(
+        self,
+        words: Iterable[Tuple[str, int, Dict[str, str], Optional[str]]],
+    ) -> None:
+        """Add many words along with their forms to the repository at once.
+
+        Stems for all words are extracted up front and then written with a
+        single repository call.
+
+        Args:
+            words: Tuples of base form, declension class, forms dictionary
+                and optional gradation pattern
 
-        # Save stems
-        for stem_type, stem in stems.items():
-            await self._repository.save_stem(word, stem_type, stem)
+        Raises:
+            ValueError: If forms are invalid or missing required forms
+        """
+        rows = [
+            (
+                Word.validated(
+                    base_form=base_form,
+                    declension_class=declension_class,
+                    gradation_type=gradation_type,
+                ),
+                WordDeclension.from_forms_dict(
+                    base_form=base_form,
+                    declension_class=declension_class,
+                    forms_dict=forms_dict,
+                    gradation_type=gradation_type,
+                ).extract_stems(),
+            )
+            for base_form, declension_class, forms_dict, gradation_type in words
+        ]
+        await self._repository.save_words_bulk(rows)
 
     async def generate_form(
         self,
@@ -82,19 +124,12 @@ class WordFormManager:
             ValueError: If required stems are missing
         """
         # Example implementation - actual rules would be more complex
-        if case == Case.NOMINATIVE:
-            if number == Number.SINGULAR:
-                return stems[StemType.STRONG]
-            return stems[StemType.PLURAL] + "t"
-
-        if case == Case.GENITIVE:
-            if number == Number.SINGULAR:
-                return stems[StemType.WEAK] + "n"
-            return stems[StemType.PLURAL] + "ien"
-
-        # Add more cases and rules as needed
-        msg = f"Form generation not implemented for {case} {number}"
-        raise ValueError(msg)
+        try:
+            rule = self._RULES[(case, number)]
+        except KeyError as e:
+            msg = f"Form generation not implemented for {case} {number}"
+            raise ValueError(msg) from e
+        return rule(stems)
 
     async def save_stem(
         self,
@@ -2,8 +2,8 @@
 Finnish noun cases as value objects.
 """
 
-from enum import Enum, auto
-from typing import List
+from enum import Enum
+from typing import Dict
 
 
 class Case(str, Enum):
@@ -22,4 +22,20 @@ class Case(str, Enum):
     TRANSLATIVE = "translative"# translatiivi (-ksi)
     INSTRUCTIVE = "instructive"# instruktiivi (-n)
     ABESSIVE = "abessive"      # abessiivi (-tta/-ttä)
-    COMITATIVE = "comitative"  # komitatiivi (-ne-) 
\ No newline at end of file
+    COMITATIVE = "comitative"  # komitatiivi (-ne-)
+
+    @classmethod
+    def from_str(cls, value: str) -> "Case":
+        """Look up a case by its name, ignoring letter case.
+
+        Raises:
+            ValueError: If the name is not a valid case
+        """
+        try:
+            return CASE_BY_VALUE[value.lower()]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid Case") from None
+
+
+# Value to member lookup that bypasses Enum.__call__ in hot parsing paths
+CASE_BY_VALUE: Dict[str, Case] = {case.value: case for case in Case}
@@ -3,10 +3,27 @@ Grammatical number (singular/plural) as value objects.
 """
 
 from enum import Enum
+from typing import Dict
 
 
 class Number(str, Enum):
     """Grammatical number in Finnish."""
     
     SINGULAR = "singular"  # yksikkö
-    PLURAL = "plural"      # monikko 
\ No newline at end of file
+    PLURAL = "plural"      # monikko
+
+    @classmethod
+    def from_str(cls, value: str) -> "Number":
+        """Look up a number by its name, ignoring letter case.
+
+        Raises:
+            ValueError: If the name is not a valid number
+        """
+        try:
+            return NUMBER_BY_VALUE[value.lower()]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid Number") from None
+
+
+# Value to member lookup that bypasses Enum.__call__ in hot parsing paths
+NUMBER_BY_VALUE: Dict[str, Number] = {number.value: number for number in Number}
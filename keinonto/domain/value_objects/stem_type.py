@@ -1,6 +1,7 @@
 """Value object for different stem types."""
 
 from enum import Enum
+from typing import Dict
 
 
 class StemType(str, Enum):
@@ -11,3 +12,9 @@ class StemType(str, Enum):
     PLURAL = "plural"  # Plural stem, used in plural forms
     ILLATIVE = "illative"  # Special stem for illative case
     GENITIVE = "genitive"  # Special stem for genitive/partitive
+
+
+# Plain dict lookups between members and their stored string values, avoiding
+# the .value descriptor and Enum.__call__ in row mapping loops
+STEM_TYPE_STR: Dict[StemType, str] = {t: t.value for t in StemType}
+STEM_TYPE_FROM_STR: Dict[str, StemType] = {v: t for t, v in STEM_TYPE_STR.items()}
@@ -6,11 +6,56 @@ from ..value_objects.case import Case
 from ..value_objects.number import Number
 from ..value_objects.stem_type import StemType
 
+# Canonical (case, number) key tuples, so form dictionaries share key objects
+# and hot lookups do not allocate a new tuple each time
+KEYS: Dict[Tuple[Case, Number], Tuple[Case, Number]] = {
+    (case, number): (case, number) for case in Case for number in Number
+}
+# Lowercase "case_number" names mapped to their canonical key tuples
+KEY_BY_NAME: Dict[str, Tuple[Case, Number]] = {
+    f"{case.value}_{number.value}": key for (case, number), key in KEYS.items()
+}
+KEY_NOM_SG = KEYS[(Case.NOMINATIVE, Number.SINGULAR)]
+KEY_GEN_SG = KEYS[(Case.GENITIVE, Number.SINGULAR)]
+KEY_NOM_PL = KEYS[(Case.NOMINATIVE, Number.PLURAL)]
+
+
+def _extract_stems_raw(
+    nom_sg: Optional[str],
+    gen_sg: Optional[str],
+    nom_pl: Optional[str],
+) -> Dict[StemType, str]:
+    """Extract stems from the forms they are derived from.
+
+    Args:
+        nom_sg: Nominative singular form, if known
+        gen_sg: Genitive singular form, if known
+        nom_pl: Nominative plural form, if known
+
+    Returns:
+        Dictionary mapping stem types to stems
+    """
+    if not nom_sg:
+        return {}
+
+    # Strong stem is the nominative singular itself
+    stems = {StemType.STRONG: nom_sg}
+
+    # Weak stem from genitive singular, plural stem from nominative plural
+    if gen_sg:
+        stems[StemType.WEAK] = gen_sg[:-1]  # Remove -n ending
+    if nom_pl:
+        stems[StemType.PLURAL] = nom_pl[:-1]  # Remove -t ending
+
+    return stems
+
 
 # pylint: disable=too-few-public-methods
 class WordForm:
     """Value object for a word form."""
 
+    __slots__ = ("form", "case", "number", "used_stem")
+
     def __init__(
         self,
         form: str,
@@ -36,6 +81,8 @@ class WordForm:
 class WordDeclension:
     """Value object for a word declension."""
 
+    __slots__ = ("base_form", "declension_class", "gradation_type", "forms")
+
     def __init__(
         self,
         base_form: str,
@@ -85,28 +132,12 @@ class WordDeclension:
         Returns:
             Dictionary mapping stem types to stems
         """
-        stems: Dict[StemType, str] = {}
-        nom_sg = self.forms.get((Case.NOMINATIVE, Number.SINGULAR))
-        gen_sg = self.forms.get((Case.GENITIVE, Number.SINGULAR))
-        nom_pl = self.forms.get((Case.NOMINATIVE, Number.PLURAL))
-
-        if not nom_sg:
-            return stems
-
-        # Extract strong stem from nominative singular
-        stems[StemType.STRONG] = nom_sg
-
-        # Extract weak stem from genitive singular if available
-        if gen_sg:
-            weak_stem = gen_sg[:-1]  # Remove -n ending
-            stems[StemType.WEAK] = weak_stem
-
-        # Extract plural stem from nominative plural if available
-        if nom_pl:
-            plural_stem = nom_pl[:-1]  # Remove -t ending
-            stems[StemType.PLURAL] = plural_stem
-
-        return stems
+        forms = self.forms
+        return _extract_stems_raw(
+            forms.get(KEY_NOM_SG),
+            forms.get(KEY_GEN_SG),
+            forms.get(KEY_NOM_PL),
+        )
 
     @classmethod
     def from_forms_dict(
@@ -131,20 +162,18 @@ class WordDeclension:
             ValueError: If case/number format is invalid
         """
         forms: Dict[Tuple[Case, Number], str] = {}
+        key_by_name = KEY_BY_NAME
 
         for case_str, form in forms_dict.items():
-            try:
-                case_part, number_part = case_str.lower().split("_")
-                case = Case(case_part)
-                number = Number(number_part)
-                forms[(case, number)] = form
-            except ValueError as e:
+            key = key_by_name.get(case_str) or key_by_name.get(case_str.lower())
+            if key is None:
                 msg = (
                     f"Invalid case/number format: {case_str}\n"
                     "Format should be 'case_number' "
                     "(e.g., 'nominative_singular')"
                 )
-                raise ValueError(msg) from e
+                raise ValueError(msg)
+            forms[key] = form
 
         return cls(
             base_form=base_form,
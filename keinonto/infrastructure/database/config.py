@@ -1,41 +1,112 @@
 """Database configuration module."""
 
 from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
 
+from sqlalchemy import delete, event, func, select
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
+    async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateIndex
+
+from .models import Base, StemModel
 
 DATABASE_URL = "sqlite+aiosqlite:///keinonto.db"
 
+# Pragmas applied to every new SQLite connection
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Stem indexes, added by init_schema to databases that predate them
+STEM_INDEX_DDL = tuple(
+    str(CreateIndex(index, if_not_exists=True).compile(dialect=sqlite.dialect()))
+    for index in sorted(
+        StemModel.metadata.tables[StemModel.__tablename__].indexes,
+        key=lambda index: str(index.name),
+    )
+)
+
 
-async def create_engine(echo: bool = False) -> AsyncEngine:
+async def create_engine(
+    echo: bool = False,
+    url: str = DATABASE_URL,
+) -> AsyncEngine:
     """Create a new database engine.
-    
+
     Args:
         echo: Whether to echo SQL statements.
+        url: Database URL to connect to.
     """
-    return create_async_engine(
-        DATABASE_URL,
+    return _new_engine(echo, url)
+
+
+def _new_engine(echo: bool = False, url: str = DATABASE_URL) -> AsyncEngine:
+    """Build an async engine with the SQLite pragmas registered."""
+    engine = create_async_engine(
+        url,
         echo=echo,
     )
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+    return engine
 
 
-@asynccontextmanager
-async def get_session() -> AsyncSession:
-    """Create a new database session."""
-    engine = await create_engine()
-    session_factory = sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-    session = session_factory()
+def _set_sqlite_pragmas(
+    dbapi_connection: Any,
+    connection_record: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Enable WAL and memory-mapped I/O on a new SQLite connection."""
+    cursor = dbapi_connection.cursor()
     try:
-        yield session
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
     finally:
-        await session.close()
-        await engine.dispose()
+        cursor.close()
+
+
+# Shared engine and session factory; creating them does not open a connection
+_engine = _new_engine()
+_session_factory = async_sessionmaker(_engine, expire_on_commit=False)
+
+
+@asynccontextmanager
+async def get_session() -> AsyncIterator[AsyncSession]:
+    """Create a new database session from the shared session factory."""
+    async with _session_factory() as session:
+        yield session
+
+
+async def shutdown() -> None:
+    """Close the connections in the shared engine's pool.
+
+    Call this once at application exit. The engine stays usable and opens
+    new connections if sessions are requested afterwards.
+    """
+    await _engine.dispose()
+
+
+async def init_schema(engine: Optional[AsyncEngine] = None) -> None:
+    """Create missing tables and indexes, upgrading older databases.
+
+    Databases created before the stem indexes existed get them here. Any
+    duplicate stems for the same word and stem type, which would block the
+    unique index, are removed first, keeping the most recently added one.
+
+    Args:
+        engine: Engine to use instead of the shared one.
+    """
+    latest_stems = select(func.max(StemModel.id)).group_by(
+        StemModel.word_id, StemModel.stem_type
+    )
+    async with (engine or _engine).begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(delete(StemModel).where(StemModel.id.not_in(latest_stems)))
+        for statement in STEM_INDEX_DDL:
+            await conn.exec_driver_sql(statement)
@@ -3,7 +3,7 @@
 # pylint: disable=too-few-public-methods,import-error
 from typing import List, Optional
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -24,6 +24,7 @@ class WordModel(Base):
     stems: Mapped[List["StemModel"]] = relationship(
         "StemModel",
         back_populates="word",
+        cascade="all, delete-orphan",
     )
 
 
@@ -31,6 +32,13 @@ class StemModel(Base):
     """SQLAlchemy model for word stems."""
 
     __tablename__ = "stems"
+    __table_args__ = (
+        # A named unique index rather than a table constraint, so that it can
+        # also be added to databases created before it existed
+        Index("uq_stems_word_stem_type", "word_id", "stem_type", unique=True),
+        # Covering index so stem reads are answered from the index alone
+        Index("ix_stems_covering", "word_id", "stem_type", "stem"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     word_id: Mapped[int] = mapped_column(ForeignKey("words.id"))
@@ -0,0 +1,241 @@
+"""SQL statements, row mapping and word cache for the SQLite repository."""
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# pylint: disable=import-error
+from sqlalchemy import Insert, Select, insert, select
+from sqlalchemy.dialects.sqlite import Insert as SQLiteInsert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import MultipleResultsFound
+from sqlalchemy.orm import selectinload
+
+from ...domain.entities.word import Word
+from ...domain.value_objects.stem_type import (
+    STEM_TYPE_FROM_STR,
+    STEM_TYPE_STR,
+    StemType,
+)
+from .models import StemModel, WordModel
+
+
+class WordCache:
+    """LRU cache of words keyed by base form."""
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of words kept in the cache.
+        """
+        self._max_size = max_size
+        self._words: "OrderedDict[str, Word]" = OrderedDict()
+
+    def __contains__(self, base_form: str) -> bool:
+        """Check whether a word is cached."""
+        return base_form in self._words
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over cached base forms, least recently used first."""
+        return iter(self._words)
+
+    def get(self, base_form: str) -> Optional[Word]:
+        """Return a cached word and mark it as recently used."""
+        word = self._words.get(base_form)
+        if word is not None:
+            self._words.move_to_end(base_form)
+        return word
+
+    def put(self, word: Word) -> None:
+        """Store a word, evicting the least recently used if full."""
+        self._words[word.base_form] = word
+        self._words.move_to_end(word.base_form)
+        if len(self._words) > self._max_size:
+            self._words.popitem(last=False)
+
+    def put_all(self, words: Iterable[Word]) -> None:
+        """Store several words."""
+        for word in words:
+            self.put(word)
+
+    def put_models(self, word_models: Iterable[WordModel]) -> Dict[str, Word]:
+        """Convert word models with loaded stems into words and store them.
+
+        Returns:
+            The converted words keyed by base form.
+
+        Raises:
+            MultipleResultsFound: If two models share a base form
+        """
+        words = {}
+        for word_model in word_models:
+            word = word_from_model(word_model)
+            if word.base_form in words:
+                raise MultipleResultsFound(f"Duplicate word: {word.base_form}")
+            self.put(word)
+            words[word.base_form] = word
+        return words
+
+    def split(self, base_forms: Iterable[str]) -> Tuple[Dict[str, Word], List[str]]:
+        """Split base forms into cached words and those not in the cache."""
+        found: Dict[str, Word] = {}
+        missing: List[str] = []
+        for base_form in dict.fromkeys(base_forms):
+            word = self.get(base_form)
+            if word is None:
+                missing.append(base_form)
+            else:
+                found[base_form] = word
+        return found, missing
+
+    def discard(self, base_form: str) -> None:
+        """Remove a word from the cache if present."""
+        self._words.pop(base_form, None)
+
+    def discard_saved(self, words: Iterable[Tuple[Word, Any]]) -> None:
+        """Remove the words of a bulk save from the cache."""
+        for word, _ in words:
+            self.discard(word.base_form)
+
+
+def select_word(base_form: str) -> Select[Tuple[WordModel]]:
+    """Build a query for a word and its stems by base form."""
+    return (
+        select(WordModel)
+        .options(selectinload(WordModel.stems))
+        .where(WordModel.base_form == base_form)
+        .execution_options(populate_existing=True)
+    )
+
+
+def select_words(base_forms: Iterable[str]) -> Select[Tuple[WordModel]]:
+    """Build a query for several words and their stems by base form."""
+    return (
+        select(WordModel)
+        .options(selectinload(WordModel.stems))
+        .where(WordModel.base_form.in_(base_forms))
+        .execution_options(populate_existing=True)
+    )
+
+
+def select_word_id(base_form: str) -> Select[Tuple[int]]:
+    """Build a query for the id of a word by base form."""
+    return select(WordModel.id).where(WordModel.base_form == base_form)
+
+
+def select_stems(base_form: str) -> Select[Tuple[str, str]]:
+    """Build a query for the stem types and stems of a word."""
+    return (
+        select(StemModel.stem_type, StemModel.stem)
+        .join(WordModel)
+        .where(WordModel.base_form == base_form)
+    )
+
+
+def select_words_with_stems() -> Select[Any]:
+    """Build a query over all words joined with their stems."""
+    return (
+        select(
+            WordModel.id,
+            WordModel.base_form,
+            WordModel.declension_class,
+            WordModel.gradation_type,
+            StemModel.stem_type,
+            StemModel.stem,
+        )
+        .outerjoin(StemModel)
+        .order_by(WordModel.id)
+    )
+
+
+def insert_words() -> Insert:
+    """Build a bulk word insert returning ids in parameter order."""
+    return insert(WordModel).returning(WordModel.id, sort_by_parameter_order=True)
+
+
+def insert_stems() -> Insert:
+    """Build a bulk stem insert."""
+    return insert(StemModel)
+
+
+def upsert_stem(word_id: int, stem_type: StemType, stem: str) -> SQLiteInsert:
+    """Build an insert that replaces an existing stem of the same type."""
+    stmt = sqlite_insert(StemModel).values(
+        word_id=word_id,
+        stem_type=STEM_TYPE_STR[stem_type],
+        stem=stem,
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[StemModel.word_id, StemModel.stem_type],
+        set_={"stem": stmt.excluded.stem},
+    )
+
+
+def word_from_model(word_model: WordModel) -> Word:
+    """Convert a word model with loaded stems into a word entity."""
+    return Word(
+        base_form=word_model.base_form,
+        declension_class=word_model.declension_class,
+        gradation_type=word_model.gradation_type,
+        stems={STEM_TYPE_FROM_STR[s.stem_type]: s.stem for s in word_model.stems},
+    )
+
+
+def stems_from_rows(rows: Iterable[Any]) -> Dict[StemType, str]:
+    """Map rows of select_stems to stems keyed by stem type."""
+    return {STEM_TYPE_FROM_STR[stem_type]: stem for stem_type, stem in rows}
+
+
+def words_from_rows(rows: Iterable[Any]) -> List[Word]:
+    """Group rows of select_words_with_stems into word entities.
+
+    Raises:
+        MultipleResultsFound: If two words share a base form
+    """
+    grouped: Dict[int, Tuple[str, int, Optional[str], Dict[StemType, str]]] = {}
+    word_ids: Dict[str, int] = {}
+    for word_id, base_form, declension_class, gradation_type, stem_type, stem in rows:
+        entry = grouped.get(word_id)
+        if entry is None:
+            if word_ids.setdefault(base_form, word_id) != word_id:
+                raise MultipleResultsFound(f"Duplicate word: {base_form}")
+            entry = (base_form, declension_class, gradation_type, {})
+            grouped[word_id] = entry
+        if stem_type is not None:
+            entry[3][STEM_TYPE_FROM_STR[stem_type]] = stem
+
+    return [
+        Word(
+            base_form=base_form,
+            declension_class=declension_class,
+            gradation_type=gradation_type,
+            stems=stems,
+        )
+        for base_form, declension_class, gradation_type, stems in grouped.values()
+    ]
+
+
+def word_rows(
+    words: Sequence[Tuple[Word, Dict[StemType, str]]]
+) -> List[Dict[str, Any]]:
+    """Build insert parameters for the words of a bulk save."""
+    return [
+        {
+            "base_form": word.base_form,
+            "declension_class": word.declension_class,
+            "gradation_type": word.gradation_type,
+        }
+        for word, _ in words
+    ]
+
+
+def stem_rows(
+    word_ids: Sequence[int],
+    words: Sequence[Tuple[Word, Dict[StemType, str]]],
+) -> List[Dict[str, Any]]:
+    """Build insert parameters for the stems of a bulk save."""
+    return [
+        {"word_id": word_id, "stem_type": STEM_TYPE_STR[stem_type], "stem": stem}
+        for word_id, (_, stems) in zip(word_ids, words)
+        for stem_type, stem in stems.items()
+    ]
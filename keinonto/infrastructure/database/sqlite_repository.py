@@ -1,58 +1,71 @@
 """SQLite word repository implementation."""
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 # pylint: disable=import-error
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from ...domain.entities.word import Word, WordStem
-from ...domain.interfaces.word_repository import IWordRepository
+from ...domain.entities.word import Word
 from ...domain.value_objects.case import Case
 from ...domain.value_objects.number import Number
 from ...domain.value_objects.stem_type import StemType
-from .models import StemModel, WordModel
+from . import queries
 
 
-class SQLiteWordRepository(IWordRepository):
-    """SQLite word repository implementation."""
+class SQLiteWordRepository:
+    """SQLite word repository implementation.
 
-    def __init__(self, session: AsyncSession) -> None:
-        """Initialize repository with database session."""
+    Words are kept in an in-memory LRU cache keyed by base form, so repeated
+    lookups of the same word skip the database round trip.
+    """
+
+    def __init__(self, session: AsyncSession, cache_size: int = 10000) -> None:
+        """Initialize repository with database session.
+
+        Args:
+            session: Database session to use.
+            cache_size: Maximum number of words kept in the word cache.
+        """
         self._session = session
+        self._word_cache = queries.WordCache(cache_size)
+
+    async def warm_cache(self) -> None:
+        """Populate the word cache with a single query over words and stems."""
+        result = await self._session.execute(queries.select_words_with_stems())
+        self._word_cache.put_all(queries.words_from_rows(result))
 
     async def get_word(self, base_form: str) -> Optional[Word]:
         """Get a word from the repository by its base form."""
-        stmt = (
-            select(WordModel)
-            .options(selectinload(WordModel.stems))
-            .where(WordModel.base_form == base_form)
-        )
-        result = await self._session.execute(stmt)
+        cached = self._word_cache.get(base_form)
+        if cached is not None:
+            return cached
+
+        result = await self._session.execute(queries.select_word(base_form))
         word_model = result.scalar_one_or_none()
 
         if word_model is None:
             return None
 
-        return Word(
-            base_form=word_model.base_form,
-            declension_class=word_model.declension_class,
-            gradation_type=word_model.gradation_type,
-            stems=[
-                WordStem(
-                    stem_type=StemType(stem.stem_type),
-                    value=stem.stem,
-                )
-                for stem in word_model.stems
-            ],
-        )
+        word = queries.word_from_model(word_model)
+        self._word_cache.put(word)
+        return word
+
+    async def get_words(self, base_forms: Sequence[str]) -> Dict[str, Word]:
+        """Get several words with one query, keyed by base form.
+
+        Base forms that are not in the repository are left out.
+        """
+        words, missing = self._word_cache.split(base_forms)
+        if missing:
+            result = await self._session.execute(queries.select_words(missing))
+            words.update(self._word_cache.put_models(result.scalars()))
+        return words
 
     async def get_form(
         self,
-        word: Word,
-        case: Case,
-        number: Number,
+        word: Word,  # pylint: disable=unused-argument
+        case: Case,  # pylint: disable=unused-argument
+        number: Number,  # pylint: disable=unused-argument
     ) -> Optional[str]:
         """Get a specific form of a word."""
         # This is a placeholder implementation that returns None
@@ -61,7 +74,7 @@ class SQLiteWordRepository(IWordRepository):
 
     async def get_all_forms(
         self,
-        word: Word,
+        word: Word,  # pylint: disable=unused-argument
     ) -> List[Tuple[Case, Number, str]]:
         """Get all available forms for a word."""
         # This is a placeholder implementation that returns an empty list
@@ -77,64 +90,71 @@ class SQLiteWordRepository(IWordRepository):
         Returns:
             A dictionary mapping stem types to their values.
         """
-        query = (
-            select(WordModel)
-            .where(WordModel.base_form == word.base_form)
-            .options(selectinload(WordModel.stems))
-        )
-        result = await self._session.execute(query)
-        word_model = result.scalar_one_or_none()
-
-        if word_model is None:
-            return {}
-
-        stems = {}
-        for stem in word_model.stems:
-            stems[StemType(stem.stem_type)] = stem.stem
-        return stems
+        result = await self._session.execute(queries.select_stems(word.base_form))
+        return queries.stems_from_rows(result)
 
     async def save_word(self, word: Word) -> None:
         """Save a word to the repository."""
-        word_model = WordModel(
-            base_form=word.base_form,
-            declension_class=word.declension_class,
-            gradation_type=word.gradation_type,
+        await self.save_words_bulk([(word, {})])
+
+    async def save_word_with_stems(
+        self,
+        word: Word,
+        stems: Dict[StemType, str],
+    ) -> None:
+        """Save a word and its stems in a single transaction.
+
+        The word is inserted with RETURNING id and all stems follow in one
+        multi-row insert, so the save takes two statements however many
+        stems there are.
+
+        Args:
+            word: The word to save.
+            stems: Dictionary mapping stem types to their values.
+        """
+        await self.save_words_bulk([(word, stems)])
+
+    async def save_words_bulk(
+        self,
+        words: Sequence[Tuple[Word, Dict[StemType, str]]],
+    ) -> None:
+        """Save many words and their stems in a single transaction.
+
+        Words and stems are each written with one executemany-style insert,
+        which SQLAlchemy batches into multi-row INSERT statements.
+
+        Args:
+            words: Pairs of a word and its stems keyed by stem type.
+        """
+        if not words:
+            return
+
+        result = await self._session.execute(
+            queries.insert_words(), queries.word_rows(words)
         )
-        self._session.add(word_model)
+        stem_rows = queries.stem_rows(result.scalars().all(), words)
+        if stem_rows:
+            await self._session.execute(queries.insert_stems(), stem_rows)
         await self._session.commit()
 
+        self._word_cache.discard_saved(words)
+
     async def save_stem(
         self,
         word: Word,
         stem_type: StemType,
         stem: str,
     ) -> None:
-        """Save a word stem."""
-        stmt = (
-            select(WordModel)
-            .options(selectinload(WordModel.stems))
-            .where(WordModel.base_form == word.base_form)
-        )
-        result = await self._session.execute(stmt)
-        word_model = result.scalar_one()
-
-        # Check if stem already exists
-        existing_stem = None
-        for stem_model in word_model.stems:
-            if stem_model.stem_type == stem_type.value:
-                existing_stem = stem_model
-                break
-
-        if existing_stem:
-            existing_stem.stem = stem
-        else:
-            # Create new stem
-            stem_model = StemModel(
-                word_id=word_model.id,
-                stem_type=stem_type.value,
-                stem=stem,
-            )
-            self._session.add(stem_model)
-            word_model.stems.append(stem_model)
+        """Save a word stem, replacing any existing stem of the same type.
 
+        Uses an SQLite upsert on the unique (word_id, stem_type) pair, so no
+        stems are loaded to tell an insert from an update.
+
+        Raises:
+            NoResultFound: If the word is not in the repository
+        """
+        result = await self._session.execute(queries.select_word_id(word.base_form))
+        word_id = result.scalar_one()
+        await self._session.execute(queries.upsert_stem(word_id, stem_type, stem))
         await self._session.commit()
+        self._word_cache.discard(word.base_form)
@@ -1,12 +1,44 @@
 """Main API for Finnish word form generation."""
 
-from typing import List, Optional, Tuple, Union
+import functools
+from typing import Iterable, List, Optional, Tuple, Union
 
 from ...domain.interfaces.word_repository import IWordRepository
 from ...domain.value_objects.case import Case
 from ...domain.value_objects.number import Number
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_case(value: str) -> Case:
+    """Parse a case name, caching the result per distinct string."""
+    return Case.from_str(value)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_number(value: str) -> Number:
+    """Parse a number name, caching the result per distinct string."""
+    return Number.from_str(value)
+
+
+def _to_case_number(
+    case: Union[str, Case],
+    number: Union[str, Number],
+) -> Tuple[Case, Number]:
+    """Convert string case and number inputs to enums if needed.
+
+    Raises:
+        ValueError: If the case or number is not valid
+    """
+    try:
+        if not isinstance(case, Case):
+            case = _parse_case(case)
+        if not isinstance(number, Number):
+            number = _parse_number(number)
+    except ValueError as e:
+        raise ValueError(f"Invalid case or number: {e}") from e
+    return case, number
+
+
 class WordGenerator:
     """Main class for generating Finnish word forms."""
 
@@ -31,16 +63,15 @@ class WordGenerator:
         Returns:
             The generated word form or None if not possible
 
+        Raises:
+            ValueError: If the case or number is not valid
+
         Example:
             >>> generator = WordGenerator(repository)
             >>> await generator.generate("talo", "inessive", "singular")
             'talossa'
         """
-        # Convert string inputs to enums if needed
-        if isinstance(case, str):
-            case = Case(case.lower())
-        if isinstance(number, str):
-            number = Number(number.lower())
+        case, number = _to_case_number(case, number)
 
         # Get word data from repository
         word_data = await self._repository.get_word(word)
@@ -50,6 +81,39 @@ class WordGenerator:
         # Get the form from repository
         return await self._repository.get_form(word_data, case, number)
 
+    async def generate_many(
+        self,
+        items: Iterable[Tuple[str, Union[str, Case], Union[str, Number]]],
+    ) -> List[Optional[str]]:
+        """
+        Generate forms for many (word, case, number) triples.
+
+        All words are fetched from the repository with a single lookup
+        before any form is generated.
+
+        Args:
+            items: Triples of base form, target case and grammatical number
+
+        Returns:
+            The generated forms in input order, None where not possible
+
+        Raises:
+            ValueError: If any case or number is not valid
+        """
+        parsed = [
+            (word, *_to_case_number(case, number)) for word, case, number in items
+        ]
+        words = await self._repository.get_words([word for word, _, _ in parsed])
+
+        forms: List[Optional[str]] = []
+        for word, case, number in parsed:
+            word_data = words.get(word)
+            if word_data is None:
+                forms.append(None)
+            else:
+                forms.append(await self._repository.get_form(word_data, case, number))
+        return forms
+
     async def get_all_forms(self, word: str) -> List[Tuple[Case, Number, str]]:
         """
         Get all available forms for a word.
@@ -0,0 +1,56 @@
+"""Shared test fixtures."""
+
+import asyncio
+from typing import Any, Iterator
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from keinonto.infrastructure.database.config import create_engine, init_schema
+
+
+def _set_test_pragmas(
+    dbapi_connection: Any,
+    connection_record: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Give test connections a 64 MiB page cache.
+
+    WAL, synchronous=NORMAL and in-memory temp storage already come from
+    the engine's own connect listener.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA cache_size=-65536")
+    finally:
+        cursor.close()
+
+
+@pytest.fixture(scope="session")
+def engine(tmp_path_factory: pytest.TempPathFactory) -> Iterator[AsyncEngine]:
+    """Create one database engine shared by the whole test session.
+
+    The database lives in a temporary directory rather than the working
+    directory. Pooled connections stay open between tests, so each test
+    skips the aiosqlite connection setup and SQLite keeps its page cache
+    warm.
+    """
+    path = tmp_path_factory.mktemp("db") / "keinonto.db"
+    shared_engine = asyncio.run(create_engine(url=f"sqlite+aiosqlite:///{path}"))
+    event.listen(shared_engine.sync_engine, "connect", _set_test_pragmas)
+    try:
+        yield shared_engine
+    finally:
+        asyncio.run(shared_engine.dispose())
+
+
+@pytest.fixture(scope="session")
+def session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Create one session factory on the shared engine."""
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+@pytest.fixture(scope="session")
+def schema(engine: AsyncEngine) -> None:
+    """Create the database tables once for the test session."""
+    asyncio.run(init_schema(engine))
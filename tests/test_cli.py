@@ -0,0 +1,189 @@
+"""Tests for CLI form validation."""
+
+import argparse
+import io
+import json
+import sys
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from keinonto.cli import (
+    CaseNumberFormatError,
+    EndingError,
+    FileError,
+    GradationError,
+    VowelHarmonyError,
+    detect_gradation_pattern,
+    load_manifest,
+    main,
+    parse_case_number,
+    positive_int,
+    run_command,
+    serve,
+    validate_form,
+    validate_forms_batch,
+)
+from keinonto.domain.value_objects.case import Case
+from keinonto.domain.value_objects.number import Number
+
+
+def test_validate_form_accepts_valid_ending() -> None:
+    """Test that a form with a valid ending passes validation."""
+    validate_form("inessive_singular", "talossa", None)
+    validate_form("genitive_plural", "talojen", None)
+
+
+def test_validate_form_rejects_invalid_ending() -> None:
+    """Test that a form with an invalid ending is rejected."""
+    with pytest.raises(EndingError):
+        validate_form("inessive_singular", "talolla", None)
+
+
+def test_validate_form_rejects_vowel_harmony_mismatch() -> None:
+    """Test that back vowel endings on a front vowel stem are rejected."""
+    with pytest.raises(VowelHarmonyError):
+        validate_form("partitive_singular", "pöytaa", None)
+
+
+def test_validate_form_uses_matched_ending_for_vowel_harmony() -> None:
+    """Test that the stem part excludes the ending that actually matched."""
+    validate_form("partitive_singular", "maata", None)
+    validate_form("partitive_plural", "taloja", None)
+
+
+def test_validate_forms_batch() -> None:
+    """Test batch validation of endings and vowel harmony."""
+    validate_forms_batch(
+        [
+            ("taloa", Case.PARTITIVE, Number.SINGULAR),
+            ("kalaa", Case.PARTITIVE, Number.SINGULAR),
+            ("talossa", Case.INESSIVE, Number.SINGULAR),
+        ]
+    )
+    with pytest.raises(VowelHarmonyError, match="pöytaa"):
+        validate_forms_batch(
+            [
+                ("taloa", Case.PARTITIVE, Number.SINGULAR),
+                ("pöytaa", Case.PARTITIVE, Number.SINGULAR),
+            ]
+        )
+    with pytest.raises(EndingError):
+        validate_forms_batch([("talolla", Case.INESSIVE, Number.SINGULAR)])
+
+
+def test_validate_form_checks_gradation_grade() -> None:
+    """Test that strong grade cases must keep the strong grade."""
+    validate_form("nominative_singular", "kauppa", "pp-p")
+    validate_form("genitive_singular", "kaupan", "pp-p")
+    with pytest.raises(GradationError):
+        validate_form("nominative_singular", "kaupa", "pp-p")
+
+
+def test_detect_gradation_pattern() -> None:
+    """Test gradation pattern detection from nominative and genitive."""
+    assert detect_gradation_pattern("kauppa", "kaupan") == "pp-p"
+    assert detect_gradation_pattern("talo", "talon") is None
+
+
+def test_parse_case_number() -> None:
+    """Test parsing case and number strings."""
+    assert parse_case_number("Inessive_Plural") == (Case.INESSIVE, Number.PLURAL)
+    with pytest.raises(CaseNumberFormatError):
+        parse_case_number("inessive")
+
+
+def test_positive_int() -> None:
+    """Test that concurrency limits must be positive integers."""
+    assert positive_int("4") == 4
+    for value in ("0", "-1", "four"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            positive_int(value)
+
+
+def test_load_manifest_resolves_forms_files(tmp_path: Path) -> None:
+    """Test that manifest forms files are resolved relative to the manifest."""
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        json.dumps(
+            [{"base_form": "talo", "declension_class": 1, "forms_file": "talo.json"}]
+        ),
+        encoding="utf-8",
+    )
+
+    entries = load_manifest(str(manifest))
+
+    assert entries[0]["forms_file"] == str(tmp_path / "talo.json")
+
+
+def test_load_manifest_rejects_incomplete_entry(tmp_path: Path) -> None:
+    """Test that manifest entries must name all required fields."""
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps([{"base_form": "talo"}]), encoding="utf-8")
+
+    with pytest.raises(FileError):
+        load_manifest(str(manifest))
+
+
+@pytest.mark.asyncio
+async def test_run_command_without_command_exits() -> None:
+    """Test that running without a command raises SystemExit."""
+    with pytest.raises(SystemExit) as exc_info:
+        await run_command(argparse.Namespace(command=None))
+    assert exc_info.value.code == 1
+
+
+@pytest.mark.asyncio
+async def test_main_returns_exit_code_on_error(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test that main reports CLI errors through its return value."""
+    missing = tmp_path / "missing.json"
+    monkeypatch.setattr(
+        sys, "argv", ["keinonto", "add-forms", "talo", "1", str(missing)]
+    )
+    assert await main() == 1
+
+
+class _FailingRepository:
+    """Repository whose first lookup fails with a database error."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_word(self, base_form: str) -> None:
+        self.calls += 1
+        if self.calls == 1:
+            raise IntegrityError("INSERT", {}, Exception("duplicate"))
+
+
+class _RecordingSession:
+    """Session stand-in that records rollbacks."""
+
+    def __init__(self) -> None:
+        self.rollbacks: List[Any] = []
+
+    async def rollback(self) -> None:
+        self.rollbacks.append(None)
+
+
+@pytest.mark.asyncio
+async def test_serve_recovers_from_database_errors(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that a database error rolls back and the loop keeps running."""
+    monkeypatch.setattr(sys, "stdin", io.StringIO("info talo\ninfo talo\n"))
+    repository = _FailingRepository()
+    session = _RecordingSession()
+
+    await serve(repository, session)  # type: ignore[arg-type]
+
+    err = capsys.readouterr().err
+    assert repository.calls == 2
+    assert len(session.rollbacks) == 1
+    assert "Database error" in err
+    assert "Word 'talo' not found" in err
@@ -1,38 +1,35 @@
 """Tests for SQLite word repository."""
 
-from typing import AsyncGenerator
+import sqlite3
+from pathlib import Path
+from typing import Any, AsyncGenerator, List
 
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.exc import MultipleResultsFound, NoResultFound
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from keinonto.domain.entities.word import Word
 from keinonto.domain.value_objects.stem_type import StemType
-from keinonto.infrastructure.database.config import create_engine
+from keinonto.infrastructure.database.config import create_engine, init_schema
 from keinonto.infrastructure.database.models import Base
 from keinonto.infrastructure.database.sqlite_repository import SQLiteWordRepository
 
 
 @pytest_asyncio.fixture(scope="function")
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session."""
-    engine = await create_engine()
+async def db_session(
+    engine: AsyncEngine,
+    schema: None,  # pylint: disable=unused-argument
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[AsyncSession, None]:
+    """Create a test database session on empty tables."""
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
 
-    session_factory = sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-    session = session_factory()
-    try:
+    async with session_factory() as session:
         yield session
-    finally:
-        await session.close()
-        await engine.dispose()
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -74,22 +71,35 @@ async def test_save_and_get_stems(
     )
     await repository.save_word(word)
 
-    # Save stems
-    async def save_stem() -> None:
-        await repository.save_stem(word, StemType.STRONG, "talo")
-
-    await save_stem()
-
-    async def save_weak_stem() -> None:
-        await repository.save_stem(word, StemType.WEAK, "talo")
-
-    await save_weak_stem()
+    # Save stems; writes stay sequential because a session cannot run
+    # concurrent operations
+    await repository.save_stem(word, StemType.STRONG, "talo")
+    await repository.save_stem(word, StemType.WEAK, "talo")
 
     result = await repository.get_word("talo")
     assert result is not None
     assert len(result.stems) == 2
 
 
+@pytest.mark.asyncio
+async def test_save_word_with_stems(
+    repository: SQLiteWordRepository,
+) -> None:
+    """Test saving a word and its stems in one call."""
+    word = Word(
+        base_form="talo",
+        declension_class=1,
+        gradation_type=None,
+    )
+    await repository.save_word_with_stems(
+        word,
+        {StemType.STRONG: "talo", StemType.PLURAL: "taloi"},
+    )
+
+    stems = await repository.get_stems(word)
+    assert stems == {StemType.STRONG: "talo", StemType.PLURAL: "taloi"}
+
+
 @pytest.mark.asyncio
 async def test_update_stem(
     repository: SQLiteWordRepository,
@@ -102,22 +112,13 @@ async def test_update_stem(
     )
     await repository.save_word(word)
 
-    # Save initial stem
-    async def save_stem() -> None:
-        await repository.save_stem(word, StemType.STRONG, "katu")
-
-    await save_stem()
-
-    # Update stem
-    async def update_stem() -> None:
-        await repository.save_stem(word, StemType.STRONG, "kadu")
-
-    await update_stem()
+    # Save initial stem, then update it
+    await repository.save_stem(word, StemType.STRONG, "katu")
+    await repository.save_stem(word, StemType.STRONG, "kadu")
 
     result = await repository.get_word("katu")
     assert result is not None
-    assert len(result.stems) == 1
-    assert result.stems[0].value == "kadu"
+    assert result.stems == {StemType.STRONG: "kadu"}
 
 
 @pytest.mark.asyncio
@@ -127,3 +128,191 @@ async def test_nonexistent_word(
     """Test retrieving a nonexistent word."""
     result = await repository.get_word("nonexistent")
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_get_word_cache_invalidated_on_save_stem(
+    repository: SQLiteWordRepository,
+) -> None:
+    """Test that cached words are refreshed after a stem is saved."""
+    word = Word(base_form="talo", declension_class=1)
+    await repository.save_word(word)
+
+    result = await repository.get_word("talo")
+    assert result is not None
+    assert result.stems == {}
+
+    await repository.save_stem(word, StemType.STRONG, "talo")
+
+    result = await repository.get_word("talo")
+    assert result is not None
+    assert result.stems == {StemType.STRONG: "talo"}
+
+
+@pytest.mark.asyncio
+async def test_save_stem_for_unknown_word(
+    repository: SQLiteWordRepository,
+) -> None:
+    """Test that saving a stem for a word not in the repository fails."""
+    with pytest.raises(NoResultFound):
+        await repository.save_stem(
+            Word(base_form="talo", declension_class=1), StemType.STRONG, "talo"
+        )
+
+
+@pytest.mark.asyncio
+async def test_duplicate_base_forms_are_rejected(
+    repository: SQLiteWordRepository,
+) -> None:
+    """Test that lookups and stem saves refuse to pick one of two words."""
+    word = Word(base_form="kuusi", declension_class=27)
+    await repository.save_words_bulk([(word, {}), (word, {})])
+
+    with pytest.raises(MultipleResultsFound):
+        await repository.get_word("kuusi")
+    with pytest.raises(MultipleResultsFound):
+        await repository.get_words(["kuusi"])
+    with pytest.raises(MultipleResultsFound):
+        await repository.warm_cache()
+    with pytest.raises(MultipleResultsFound):
+        await repository.save_stem(word, StemType.STRONG, "kuusi")
+
+
+@pytest.mark.asyncio
+async def test_warm_cache(engine: AsyncEngine, db_session: AsyncSession) -> None:
+    """Test that warming the cache loads words with and without stems."""
+    writer = SQLiteWordRepository(db_session)
+    await writer.save_word_with_stems(
+        Word(base_form="talo", declension_class=1),
+        {StemType.STRONG: "talo", StemType.PLURAL: "taloi"},
+    )
+    await writer.save_word(Word(base_form="kala", declension_class=9))
+
+    statements: List[str] = []
+
+    def record(*args: Any) -> None:
+        statements.append(args[2])
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        repository = SQLiteWordRepository(db_session, cache_size=1)
+        await repository.warm_cache()
+        statements.clear()
+        assert await repository.get_word("kala") is not None
+        assert not statements
+        assert await repository.get_word("talo") is not None
+        assert statements
+
+        repository = SQLiteWordRepository(db_session)
+        await repository.warm_cache()
+        statements.clear()
+        talo = await repository.get_word("talo")
+        kala = await repository.get_word("kala")
+        assert not statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+    assert talo is not None
+    assert talo.stems == {StemType.STRONG: "talo", StemType.PLURAL: "taloi"}
+    assert kala is not None and kala.stems == {}
+
+
+@pytest.mark.asyncio
+async def test_save_words_bulk(
+    repository: SQLiteWordRepository,
+) -> None:
+    """Test saving many words and their stems in one call."""
+    await repository.save_words_bulk(
+        [
+            (
+                Word(base_form="talo", declension_class=1),
+                {StemType.STRONG: "talo", StemType.PLURAL: "taloi"},
+            ),
+            (Word(base_form="kala", declension_class=9), {}),
+            (
+                Word(base_form="katu", declension_class=1, gradation_type="t-d"),
+                {StemType.WEAK: "kadu"},
+            ),
+        ]
+    )
+
+    talo = await repository.get_word("talo")
+    kala = await repository.get_word("kala")
+    katu = await repository.get_word("katu")
+    assert talo is not None and kala is not None and katu is not None
+    assert talo.stems == {StemType.STRONG: "talo", StemType.PLURAL: "taloi"}
+    assert kala.stems == {}
+    assert katu.gradation_type == "t-d"
+    assert katu.stems == {StemType.WEAK: "kadu"}
+
+
+@pytest.mark.asyncio
+async def test_get_words(
+    repository: SQLiteWordRepository,
+) -> None:
+    """Test fetching several words at once, from the cache and the database."""
+    await repository.save_words_bulk(
+        [
+            (Word(base_form="talo", declension_class=1), {StemType.STRONG: "talo"}),
+            (Word(base_form="kala", declension_class=9), {}),
+        ]
+    )
+    assert await repository.get_word("kala") is not None
+
+    words = await repository.get_words(["talo", "kala", "talo", "nonexistent"])
+
+    assert sorted(words) == ["kala", "talo"]
+    assert words["talo"].stems == {StemType.STRONG: "talo"}
+
+
+@pytest.mark.asyncio
+async def test_connection_pragmas(db_session: AsyncSession) -> None:
+    """Test that test connections use WAL and the larger page cache."""
+    connection = await db_session.connection()
+    journal_mode = await connection.exec_driver_sql("PRAGMA journal_mode")
+    assert journal_mode.scalar() == "wal"
+    synchronous = await connection.exec_driver_sql("PRAGMA synchronous")
+    assert synchronous.scalar() == 1  # NORMAL
+    cache_size = await connection.exec_driver_sql("PRAGMA cache_size")
+    assert cache_size.scalar() == -65536
+
+
+@pytest.mark.asyncio
+async def test_init_schema_upgrades_old_database(tmp_path: Path) -> None:
+    """Test that init_schema deduplicates stems and adds the stem indexes."""
+    path = tmp_path / "old.db"
+    with sqlite3.connect(path) as conn:
+        conn.executescript(
+            """
+            CREATE TABLE words (
+                id INTEGER PRIMARY KEY,
+                base_form VARCHAR(50) NOT NULL,
+                declension_class INTEGER NOT NULL,
+                gradation_type VARCHAR(10)
+            );
+            CREATE TABLE stems (
+                id INTEGER PRIMARY KEY,
+                word_id INTEGER NOT NULL REFERENCES words (id),
+                stem_type VARCHAR(20) NOT NULL,
+                stem VARCHAR(50) NOT NULL
+            );
+            INSERT INTO words VALUES (1, 'katu', 1, 't-d');
+            INSERT INTO stems VALUES (1, 1, 'weak', 'katu');
+            INSERT INTO stems VALUES (2, 1, 'weak', 'kadu');
+            """
+        )
+    conn.close()
+
+    engine = await create_engine(url=f"sqlite+aiosqlite:///{path}")
+    try:
+        await init_schema(engine)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            repository = SQLiteWordRepository(session)
+            word = await repository.get_word("katu")
+            assert word is not None
+            assert word.stems == {StemType.WEAK: "kadu"}
+
+            await repository.save_stem(word, StemType.WEAK, "katu")
+            assert await repository.get_stems(word) == {StemType.WEAK: "katu"}
+    finally:
+        await engine.dispose()
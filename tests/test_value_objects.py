@@ -0,0 +1,35 @@
+"""Tests for value objects."""
+
+import pytest
+
+from keinonto.domain.value_objects.case import Case
+from keinonto.domain.value_objects.number import Number
+from keinonto.domain.value_objects.word_form import KEY_NOM_SG, WordDeclension
+
+
+def test_from_str_ignores_letter_case() -> None:
+    """Test that case and number names are parsed case-insensitively."""
+    assert Case.from_str("Inessive") is Case.INESSIVE
+    assert Case.from_str(Case.ELATIVE) is Case.ELATIVE
+    assert Number.from_str("PLURAL") is Number.PLURAL
+
+
+def test_from_str_rejects_unknown_names() -> None:
+    """Test that unknown names raise ValueError."""
+    with pytest.raises(ValueError):
+        Case.from_str("vocative")
+    with pytest.raises(ValueError):
+        Number.from_str("dual")
+
+
+def test_from_forms_dict_uses_canonical_keys() -> None:
+    """Test that parsed forms are stored under the shared key tuples."""
+    declension = WordDeclension.from_forms_dict(
+        "talo", 1, {"Nominative_Singular": "talo", "genitive_singular": "talon"}
+    )
+    key = next(iter(declension.forms))
+    assert key is KEY_NOM_SG
+    assert declension.forms[(Case.GENITIVE, Number.SINGULAR)] == "talon"
+
+    with pytest.raises(ValueError, match="nominative"):
+        WordDeclension.from_forms_dict("talo", 1, {"nominative": "talo"})
@@ -0,0 +1,42 @@
+"""Tests for the word entity."""
+
+import pytest
+
+from keinonto.domain.entities.word import Word
+from keinonto.domain.value_objects.stem_type import StemType
+
+
+def test_word_rejects_invalid_declension_class() -> None:
+    """Test that the declension class must be between 1 and 51."""
+    with pytest.raises(ValueError):
+        Word(base_form="talo", declension_class=52)
+
+
+def test_validated_coerces_field_types() -> None:
+    """Test that validated words have their field types coerced."""
+    word = Word.validated(
+        base_form="talo",
+        declension_class="1",  # type: ignore[arg-type]
+        stems={"strong": "talo"},  # type: ignore[dict-item]
+    )
+    assert word.declension_class == 1
+    assert word.stems == {StemType.STRONG: "talo"}
+
+
+def test_validated_rejects_invalid_input() -> None:
+    """Test that validated words reject invalid field values."""
+    with pytest.raises(ValueError):
+        Word.validated(base_form="talo", declension_class=0)
+    with pytest.raises(ValueError):
+        Word.validated(base_form=None, declension_class=1)  # type: ignore[arg-type]
+
+
+def test_word_stems_are_read_only() -> None:
+    """Test that stems are copied and cannot be changed through the word."""
+    stems = {StemType.STRONG: "talo"}
+    word = Word(base_form="talo", declension_class=1, stems=stems)
+    stems[StemType.WEAK] = "talo"
+
+    assert word.stems == {StemType.STRONG: "talo"}
+    with pytest.raises(TypeError):
+        word.stems[StemType.WEAK] = "talo"  # type: ignore[index]
@@ -0,0 +1,171 @@
+"""Tests for the word form manager service."""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pytest
+from pytest import fixture
+
+from keinonto.domain.entities.word import Word
+from keinonto.domain.services.word_form_manager import WordFormManager
+from keinonto.domain.value_objects.case import Case
+from keinonto.domain.value_objects.number import Number
+from keinonto.domain.value_objects.stem_type import StemType
+
+
+class RecordingWordRepository:
+    """In-memory repository that records saved words and stems."""
+
+    def __init__(self) -> None:
+        """Initialize the repository with empty storage."""
+        self.words: Dict[str, Word] = {}
+        self.stems: Dict[str, Dict[StemType, str]] = {}
+
+    async def get_word(self, base_form: str) -> Optional[Word]:
+        """Get a word from the repository."""
+        return self.words.get(base_form)
+
+    async def get_words(self, base_forms: Sequence[str]) -> Dict[str, Word]:
+        """Get several words from the repository."""
+        return {b: self.words[b] for b in base_forms if b in self.words}
+
+    async def get_form(
+        self,
+        word: Word,
+        case: Case,
+        number: Number,
+    ) -> Optional[str]:
+        """Get a specific form of a word."""
+        return None
+
+    async def get_all_forms(
+        self,
+        word: Word,
+    ) -> List[Tuple[Case, Number, str]]:
+        """Get all forms for a word."""
+        return []
+
+    async def get_stems(self, word: Word) -> Dict[StemType, str]:
+        """Get all stems for a word."""
+        return self.stems.get(word.base_form, {})
+
+    async def save_word(self, word: Word) -> None:
+        """Save a word to the repository."""
+        self.words[word.base_form] = word
+
+    async def save_word_with_stems(
+        self,
+        word: Word,
+        stems: Dict[StemType, str],
+    ) -> None:
+        """Save a word and its stems to the repository."""
+        self.words[word.base_form] = word
+        self.stems[word.base_form] = dict(stems)
+
+    async def save_words_bulk(
+        self,
+        words: Sequence[Tuple[Word, Dict[StemType, str]]],
+    ) -> None:
+        """Save many words and their stems to the repository."""
+        for word, stems in words:
+            await self.save_word_with_stems(word, stems)
+
+    async def save_stem(
+        self,
+        word: Word,
+        stem_type: StemType,
+        stem: str,
+    ) -> None:
+        """Save a stem for a word."""
+        self.stems.setdefault(word.base_form, {})[stem_type] = stem
+
+
+@fixture(scope="function")
+def repository() -> RecordingWordRepository:
+    """Create an empty recording repository."""
+    return RecordingWordRepository()
+
+
+@fixture(scope="function")
+def manager(repository: RecordingWordRepository) -> WordFormManager:
+    """Create a word form manager for testing."""
+    return WordFormManager(repository)
+
+
+@pytest.mark.asyncio
+async def test_add_word_with_forms_saves_stems(
+    manager: WordFormManager,
+    repository: RecordingWordRepository,
+) -> None:
+    """Test that adding a word extracts and saves its stems."""
+    await manager.add_word_with_forms(
+        base_form="laatikko",
+        declension_class=4,
+        forms_dict={
+            "nominative_singular": "laatikko",
+            "genitive_singular": "laatikon",
+            "nominative_plural": "laatikot",
+        },
+        gradation_type="kk-k",
+    )
+
+    assert repository.words["laatikko"].declension_class == 4
+    assert repository.stems["laatikko"] == {
+        StemType.STRONG: "laatikko",
+        StemType.WEAK: "laatiko",
+        StemType.PLURAL: "laatiko",
+    }
+
+
+@pytest.mark.asyncio
+async def test_generate_form(manager: WordFormManager) -> None:
+    """Test generating forms from stems."""
+    word = Word(base_form="talo", declension_class=1)
+    stems = {
+        StemType.STRONG: "talo",
+        StemType.WEAK: "talo",
+        StemType.PLURAL: "talo",
+    }
+
+    generated = await manager.generate_form(word, stems, Case.GENITIVE, Number.PLURAL)
+    assert generated == "taloien"
+    generated = await manager.generate_form(word, stems, Case.NOMINATIVE, Number.PLURAL)
+    assert generated == "talot"
+
+
+@pytest.mark.asyncio
+async def test_generate_form_unsupported_case(manager: WordFormManager) -> None:
+    """Test that unsupported cases are rejected."""
+    word = Word(base_form="talo", declension_class=1)
+    with pytest.raises(ValueError):
+        await manager.generate_form(
+            word, {StemType.STRONG: "talo"}, Case.ESSIVE, Number.SINGULAR
+        )
+
+
+@pytest.mark.asyncio
+async def test_add_words_bulk_saves_stems(
+    manager: WordFormManager,
+    repository: RecordingWordRepository,
+) -> None:
+    """Test that bulk adding words extracts and saves stems for each word."""
+    await manager.add_words_bulk(
+        [
+            (
+                "talo",
+                1,
+                {"nominative_singular": "talo", "genitive_singular": "talon"},
+                None,
+            ),
+            (
+                "laatikko",
+                4,
+                {"nominative_singular": "laatikko", "nominative_plural": "laatikot"},
+                "kk-k",
+            ),
+        ]
+    )
+
+    assert repository.stems == {
+        "talo": {StemType.STRONG: "talo", StemType.WEAK: "talo"},
+        "laatikko": {StemType.STRONG: "laatikko", StemType.PLURAL: "laatiko"},
+    }
@@ -1,19 +1,18 @@
 """Tests for word form generation."""
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import pytest
 from pytest import fixture
 
 from keinonto.domain.entities.word import Word
-from keinonto.domain.interfaces.word_repository import IWordRepository
 from keinonto.domain.value_objects.case import Case
 from keinonto.domain.value_objects.number import Number
 from keinonto.domain.value_objects.stem_type import StemType
 from keinonto.presentation.api.word_generator import WordGenerator
 
 
-class MockWordRepository(IWordRepository):
+class MockWordRepository:
     """Mock implementation of word repository for testing."""
 
     async def get_word(self, base_form: str) -> Optional[Word]:
@@ -26,6 +25,15 @@ class MockWordRepository(IWordRepository):
             )
         return None
 
+    async def get_words(self, base_forms: Sequence[str]) -> Dict[str, Word]:
+        """Get several words from the repository."""
+        words = {}
+        for base_form in base_forms:
+            word = await self.get_word(base_form)
+            if word is not None:
+                words[base_form] = word
+        return words
+
     async def get_stems(self, word: Word) -> Dict[StemType, str]:
         """Get all stems for a word."""
         if word.base_form == "kissa":
@@ -38,6 +46,19 @@ class MockWordRepository(IWordRepository):
     async def save_word(self, word: Word) -> None:
         """Save a word to the repository."""
 
+    async def save_word_with_stems(
+        self,
+        word: Word,
+        stems: Dict[StemType, str],
+    ) -> None:
+        """Save a word and its stems to the repository."""
+
+    async def save_words_bulk(
+        self,
+        words: Sequence[Tuple[Word, Dict[StemType, str]]],
+    ) -> None:
+        """Save many words and their stems to the repository."""
+
     async def save_stem(
         self,
         word: Word,
@@ -86,6 +107,24 @@ async def test_generate_existing_word(
     assert form == "kissassa"
 
 
+@pytest.mark.asyncio
+async def test_generate_from_strings(
+    generator: WordGenerator,
+) -> None:
+    """Test generating forms with case and number given as strings."""
+    form = await generator.generate("kissa", "Inessive", "singular")
+    assert form == "kissassa"
+
+
+@pytest.mark.asyncio
+async def test_generate_invalid_case(
+    generator: WordGenerator,
+) -> None:
+    """Test that an unknown case name is rejected."""
+    with pytest.raises(ValueError):
+        await generator.generate("kissa", "sisaolento", "singular")
+
+
 @pytest.mark.asyncio
 async def test_generate_nonexistent_word(
     generator: WordGenerator,
@@ -95,6 +134,23 @@ async def test_generate_nonexistent_word(
     assert form is None
 
 
+@pytest.mark.asyncio
+async def test_generate_many(
+    generator: WordGenerator,
+) -> None:
+    """Test generating forms for several words in one call."""
+    forms = await generator.generate_many(
+        [
+            ("kissa", "inessive", "singular"),
+            ("koira", Case.INESSIVE, Number.SINGULAR),
+            ("kissa", Case.INESSIVE, Number.PLURAL),
+        ]
+    )
+    assert forms == ["kissassa", None, None]
+    with pytest.raises(ValueError):
+        await generator.generate_many([("kissa", "sisaolento", "singular")])
+
+
 @pytest.mark.asyncio
 async def test_get_all_forms_existing_word(
     generator: WordGenerator,